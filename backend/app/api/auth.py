@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 from app.database.database import get_db
 from app.models.models import User
 from app.services.auth_service import AuthService
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, ConfigDict
 from typing import Optional
 
 router = APIRouter()
@@ -23,15 +23,14 @@ class UserResponse(BaseModel):
     is_active: bool
     is_verified: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Token(BaseModel):
     access_token: str
     token_type: str
 
 @router.post("/register", response_model=UserResponse)
-async def register(
+def register(
     user_data: UserCreate,
     db: Session = Depends(get_db)
 ):
@@ -55,7 +54,7 @@ async def register(
     return user
 
 @router.post("/login", response_model=Token)
-async def login(
+def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
@@ -76,7 +75,7 @@ async def login(
     
     return {"access_token": access_token, "token_type": "bearer"}
 
-async def get_current_user(
+def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
@@ -1,19 +1,105 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import HTTPBearer
+from sqlalchemy import func, select, text, tuple_
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.database.database import get_db
 from app.models.models import Job, JobApplication
-from app.services.linkedin_scraper import scrape_linkedin_jobs
-from app.services.linkedin_api_service import search_linkedin_jobs_api
-from app.services.linkedin_oauth_service import LinkedInOAuthService, get_linkedin_auth_url
-from pydantic import BaseModel
+from app.services.linkedin_oauth_service import LinkedInOAuthService, get_linkedin_auth_url, get_oauth_service
+from app.services.job_storage import insert_new_jobs
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
+from cachetools import TTLCache
+import threading
+import binascii
+import hashlib
+import base64
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# In-process cache for /stats/summary; cleared whenever this API writes jobs
+STATS_CACHE_TTL_SECONDS = 60
+_stats_cache = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL_SECONDS)
+_stats_cache_lock = threading.Lock()
+
+# Serialized GET /jobs/ responses keyed by the query parameters; same
+# lifetime and invalidation as the stats cache. Server-side only (clients
+# revalidate via ETag), kept small, and free-text searches are not cached.
+JOBS_LIST_CACHE_TTL_SECONDS = 60
+_jobs_list_cache = TTLCache(maxsize=128, ttl=JOBS_LIST_CACHE_TTL_SECONDS)
+_jobs_list_cache_lock = threading.Lock()
+
+def _invalidate_job_caches():
+    """Drop cached job data after new jobs are saved"""
+    with _stats_cache_lock:
+        _stats_cache.clear()
+    with _jobs_list_cache_lock:
+        _jobs_list_cache.clear()
+
+def _job_list_response(request: Request, body: bytes, headers: dict) -> Response:
+    """Serialized job list, or 304 when the client already has this version"""
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+# Columns serialized by JobResponse; the listing selects only these
+_JOB_LIST_COLUMNS = (
+    Job.id, Job.title, Job.company, Job.location, Job.description,
+    Job.employment_type, Job.seniority_level, Job.linkedin_url,
+    Job.requires_english, Job.match_score, Job.posted_date, Job.scraped_at
+)
+
+# Base statement for GET /jobs/: active jobs as plain rows, newest first
+# (id breaks ties for the cursor). Undated jobs sort last on every database
+# (PostgreSQL puts NULLs first on DESC), so they never cut the cursor chain
+# short before the dated jobs are exhausted. Optional filters are appended per request;
+# each filter combination gets its own entry in SQLAlchemy's compiled cache.
+_ACTIVE_JOBS_STMT = (
+    select(*_JOB_LIST_COLUMNS)
+    .where(Job.is_active == True)
+    .order_by(Job.posted_date.desc().nulls_last(), Job.id.desc())
+)
+
+# Keyset pagination cursor for GET /jobs/: base64 of "<posted_date iso>|<id>"
+def _encode_job_cursor(posted_date: datetime, job_id: int) -> str:
+    raw = f"{posted_date.isoformat()}|{job_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _decode_job_cursor(cursor: str):
+    try:
+        posted_date, job_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(posted_date), int(job_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+# Job statistics: one pass for both counts, one UNION ALL for both top-5 lists.
+# UNION ALL does not preserve the branches' ORDER BY, so the outer ORDER BY
+# ranks each list (name breaks ties so the top 5 is deterministic)
+_STATS_COUNTS_SQL = text("""
+    SELECT count(*), count(*) FILTER (WHERE NOT requires_english)
+    FROM jobs
+    WHERE is_active
+""")
+
+_STATS_TOP_SQL = text("""
+    WITH active AS (
+        SELECT company, location FROM jobs WHERE is_active
+    )
+    SELECT * FROM (
+        SELECT 'company' AS kind, company AS name, count(*) AS count
+        FROM active GROUP BY company ORDER BY count(*) DESC, company LIMIT 5
+    ) AS top_companies
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'location' AS kind, location AS name, count(*) AS count
+        FROM active GROUP BY location ORDER BY count(*) DESC, location LIMIT 5
+    ) AS top_locations
+    ORDER BY kind, count DESC, name
+""")
+
 # Pydantic models for request/response
 class JobResponse(BaseModel):
     id: int
@@ -29,8 +115,7 @@ class JobResponse(BaseModel):
     posted_date: Optional[datetime]
     scraped_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class JobSearchParams(BaseModel):
     search_term: str = "DevOps"
@@ -83,23 +168,28 @@ class OAuthJobSearchRequest(BaseModel):
     limit: int = 50
 
 @router.post("/scrape", response_model=ScrapeResponse)
-async def trigger_job_scrape(
+def trigger_job_scrape(
     params: JobSearchParams,
     db: Session = Depends(get_db)
 ):
     """
     Trigger LinkedIn job scraping
     """
+    # Imported on first scrape: Selenium, webdriver-manager, bs4 and lxml
+    # would otherwise load in every worker at startup
+    from app.services.linkedin_scraper import run_scheduled_scraping
+    
     try:
         logger.info(f"Starting job scrape: {params.search_term} in {params.location}")
         
-        result = scrape_linkedin_jobs(
+        result = run_scheduled_scraping(
             search_term=params.search_term,
             location=params.location,
             max_jobs=params.max_jobs
         )
         
         if result['success']:
+            _invalidate_job_caches()
             return ScrapeResponse(
                 success=True,
                 jobs_found=result['jobs_found'],
@@ -118,25 +208,30 @@ async def trigger_job_scrape(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/scrape-api", response_model=LinkedInAPIResponse)
-async def trigger_linkedin_api_search(
+def trigger_linkedin_api_search(
     params: LinkedInAPIParams,
     db: Session = Depends(get_db)
 ):
     """
     Trigger LinkedIn API job search with user credentials
     """
+    # Imported on first use, like the scraper (pulls in the linkedin_api client)
+    from app.services.linkedin_api_service import search_linkedin_jobs_api
+    
     try:
         logger.info(f"Starting LinkedIn API search: {params.keywords} in {params.location}")
         
         result = search_linkedin_jobs_api(
             email=params.email,
             password=params.password,
+            db=db,
             keywords=params.keywords,
             location=params.location,
             limit=params.limit
         )
         
         if result['success']:
+            _invalidate_job_caches()
             return LinkedInAPIResponse(
                 success=True,
                 jobs_found=result['jobs_found'],
@@ -199,15 +294,17 @@ async def get_oauth_authorization_url():
         )
 
 @router.post("/oauth/token", response_model=OAuthTokenResponse)
-async def exchange_oauth_code_for_token(request: OAuthTokenRequest):
+async def exchange_oauth_code_for_token(
+    request: OAuthTokenRequest,
+    oauth_service: LinkedInOAuthService = Depends(get_oauth_service)
+):
     """
     Exchange OAuth authorization code for access token
     """
     try:
         logger.info("Exchanging OAuth code for access token")
         
-        oauth_service = LinkedInOAuthService()
-        result = oauth_service.get_access_token_from_code(
+        result = await oauth_service.get_access_token_from_code(
             request.authorization_code, 
             request.state
         )
@@ -235,17 +332,18 @@ async def exchange_oauth_code_for_token(request: OAuthTokenRequest):
         )
 
 @router.post("/oauth/search", response_model=LinkedInAPIResponse)
-async def search_jobs_with_oauth(request: OAuthJobSearchRequest):
+async def search_jobs_with_oauth(
+    request: OAuthJobSearchRequest,
+    oauth_service: LinkedInOAuthService = Depends(get_oauth_service)
+):
     """
     Search LinkedIn jobs using OAuth access token
     """
     try:
         logger.info(f"OAuth job search: {request.keywords} in {request.location}")
         
-        oauth_service = LinkedInOAuthService()
-        oauth_service.access_token = request.access_token
-        
-        result = oauth_service.search_jobs_oauth(
+        result = await oauth_service.search_jobs_oauth(
+            request.access_token,
             request.keywords,
             request.location,
             request.limit
@@ -284,9 +382,11 @@ async def search_jobs_with_oauth(request: OAuthJobSearchRequest):
         )
 
 @router.get("/", response_model=List[JobResponse])
-async def get_jobs(
+def get_jobs(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
     no_english: bool = Query(False),
     company: Optional[str] = Query(None),
@@ -295,40 +395,88 @@ async def get_jobs(
 ):
     """
     Get filtered job listings
+    
+    Paginate with the opaque `cursor` returned in the X-Next-Cursor header
+    (keyset on posted_date, id). `skip` is kept for compatibility and falls
+    back to OFFSET. Jobs without posted_date come after all dated jobs and
+    are only reachable via `skip` once the cursor chain ends.
+    
+    X-Total-Count holds the number of matching jobs. It is computed in the
+    same query (count(*) OVER ()) and only sent on pages requested without a
+    cursor, so keyset pages never pay for a scan of the whole match set.
     """
+    last_key = _decode_job_cursor(cursor) if cursor else None
+    
+    cache_key = None if search else (skip, limit, cursor, no_english, company, location)
+    if cache_key is not None:
+        with _jobs_list_cache_lock:
+            cached = _jobs_list_cache.get(cache_key)
+        if cached is not None:
+            body, headers = cached
+            return _job_list_response(request, body, headers)
+    
     try:
-        query = db.query(Job).filter(Job.is_active == True)
+        stmt = _ACTIVE_JOBS_STMT
         
         # Apply filters
         if no_english:
-            query = query.filter(Job.requires_english == False)
+            stmt = stmt.where(Job.requires_english == False)
             
+        # Case-insensitive substring filters, served by the pg_trgm GIN indexes
         if search:
-            query = query.filter(
-                Job.title.contains(search) | 
-                Job.description.contains(search)
+            search_pattern = f"%{search}%"
+            stmt = stmt.where(
+                Job.title.ilike(search_pattern) | 
+                Job.description.ilike(search_pattern)
             )
             
         if company:
-            query = query.filter(Job.company.contains(company))
+            stmt = stmt.where(Job.company.ilike(f"%{company}%"))
             
         if location:
-            query = query.filter(Job.location.contains(location))
+            stmt = stmt.where(Job.location.ilike(f"%{location}%"))
+        
+        # Pagination: keyset when a cursor is given, OFFSET otherwise
+        if last_key:
+            stmt = stmt.where(tuple_(Job.posted_date, Job.id) < tuple_(*last_key))
+        else:
+            stmt = stmt.add_columns(func.count().over().label("total_count"))
+            if skip:
+                logger.warning("GET /jobs/ with skip is deprecated, use cursor pagination")
+                stmt = stmt.offset(skip)
+        
+        # Rows go straight to orjson; Pydantic validation is skipped on this hot path
+        jobs = [dict(row) for row in db.execute(stmt.limit(limit)).mappings()]
+        
+        headers = {}
+        if not last_key:
+            if jobs:
+                headers["X-Total-Count"] = str(jobs[0]["total_count"])
+            elif not skip:
+                headers["X-Total-Count"] = "0"
+            for job in jobs:
+                del job["total_count"]
         
-        # Order by posted date (newest first)
-        query = query.order_by(Job.posted_date.desc())
+        if len(jobs) == limit and jobs[-1]["posted_date"] is not None:
+            headers["X-Next-Cursor"] = _encode_job_cursor(jobs[-1]["posted_date"], jobs[-1]["id"])
         
-        # Pagination
-        jobs = query.offset(skip).limit(limit).all()
+        body = ORJSONResponse(jobs).body
+        # Clients must revalidate (a scrape can change the list at any time);
+        # the ETag lets unchanged pages come back as 304 without a body
+        headers["Cache-Control"] = "private, no-cache"
+        headers["ETag"] = f'"{hashlib.sha1(body).hexdigest()}"'
         
-        return jobs
+        if cache_key is not None:
+            with _jobs_list_cache_lock:
+                _jobs_list_cache[cache_key] = (body, headers)
+        return _job_list_response(request, body, headers)
         
     except Exception as e:
         logger.error(f"Error fetching jobs: {e}")
         raise HTTPException(status_code=500, detail="Error fetching jobs")
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_job(
+def get_job(
     job_id: int,
     db: Session = Depends(get_db)
 ):
@@ -342,32 +490,26 @@ async def get_job(
     return job
 
 @router.get("/stats/summary")
-async def get_job_stats(db: Session = Depends(get_db)):
+def get_job_stats(db: Session = Depends(get_db)):
     """
     Get job statistics summary
     """
+    with _stats_cache_lock:
+        cached_stats = _stats_cache.get("summary")
+    if cached_stats is not None:
+        return cached_stats
+    
     try:
-        total_jobs = db.query(Job).filter(Job.is_active == True).count()
-        jobs_without_english = db.query(Job).filter(
-            Job.is_active == True, 
-            Job.requires_english == False
-        ).count()
-        
-        # Top companies
-        top_companies = db.query(Job.company, db.func.count(Job.id).label('count'))\
-            .filter(Job.is_active == True)\
-            .group_by(Job.company)\
-            .order_by(db.text('count DESC'))\
-            .limit(5).all()
+        total_jobs, jobs_without_english = db.execute(_STATS_COUNTS_SQL).one()
         
-        # Top locations
-        top_locations = db.query(Job.location, db.func.count(Job.id).label('count'))\
-            .filter(Job.is_active == True)\
-            .group_by(Job.location)\
-            .order_by(db.text('count DESC'))\
-            .limit(5).all()
+        # Top companies and locations from a single UNION ALL, dispatched by kind
+        top_companies = []
+        top_locations = []
+        for kind, name, count in db.execute(_STATS_TOP_SQL):
+            target = top_companies if kind == "company" else top_locations
+            target.append((name, count))
         
-        return {
+        stats = {
             "total_jobs": total_jobs,
             "jobs_without_english": jobs_without_english,
             "english_percentage": round((total_jobs - jobs_without_english) / total_jobs * 100, 2) if total_jobs > 0 else 0,
@@ -375,111 +517,112 @@ async def get_job_stats(db: Session = Depends(get_db)):
             "top_locations": [{"name": location, "count": count} for location, count in top_locations]
         }
         
+        with _stats_cache_lock:
+            _stats_cache["summary"] = stats
+        
+        return stats
+        
     except Exception as e:
         logger.error(f"Error getting job stats: {e}")
         raise HTTPException(status_code=500, detail="Error getting statistics")
 
+# Seed jobs for POST /seed-test-data; dates are stamped per request
+_TEST_JOB_TEMPLATES = (
+    {
+        "title": "DevOps Engineer - TEST",
+        "company": "TechCorp Chile",
+        "location": "Santiago, Chile",
+        "description": "Buscamos un DevOps Engineer con experiencia en AWS, Docker y Kubernetes. Trabajo remoto disponible.",
+        "requirements": "3+ años experiencia, Docker, Kubernetes, CI/CD",
+        "employment_type": "Full-time",
+        "seniority_level": "Mid-level",
+        "linkedin_job_id": "test-job-001",
+        "linkedin_url": "https://linkedin.com/jobs/test-001",
+        "requires_english": False,
+        "match_score": 0.95,
+        "is_active": True
+    },
+    {
+        "title": "Senior DevOps Engineer - TEST",
+        "company": "InnovaTech",
+        "location": "Valparaíso, Chile",
+        "description": "Empresa chilena busca Senior DevOps para liderar transformación digital. Excelente ambiente laboral.",
+        "requirements": "5+ años experiencia, AWS, Terraform, Python",
+        "employment_type": "Full-time",
+        "seniority_level": "Senior",
+        "linkedin_job_id": "test-job-002",
+        "linkedin_url": "https://linkedin.com/jobs/test-002",
+        "requires_english": False,
+        "match_score": 0.88,
+        "is_active": True
+    },
+    {
+        "title": "DevOps Specialist - TEST",
+        "company": "StartupChile",
+        "location": "Concepción, Chile", 
+        "description": "Startup innovadora busca DevOps para implementar infraestructura escalable. Sin requisito de inglés.",
+        "requirements": "2+ años experiencia, Git, Jenkins, Linux",
+        "employment_type": "Full-time",
+        "seniority_level": "Junior",
+        "linkedin_job_id": "test-job-003",
+        "linkedin_url": "https://linkedin.com/jobs/test-003",
+        "requires_english": False,
+        "match_score": 0.78,
+        "is_active": True
+    },
+    {
+        "title": "Platform Engineer - TEST",
+        "company": "CloudSolutions",
+        "location": "La Serena, Chile",
+        "description": "Ingeniero de plataforma para arquitectura cloud. Trabajo 100% en español.",
+        "requirements": "3+ años experiencia, GCP, Docker, Monitoring",
+        "employment_type": "Contract",
+        "seniority_level": "Mid-level",
+        "linkedin_job_id": "test-job-004",
+        "linkedin_url": "https://linkedin.com/jobs/test-004",
+        "requires_english": False,
+        "match_score": 0.82,
+        "is_active": True
+    },
+    {
+        "title": "Infrastructure Engineer - TEST",
+        "company": "DigitalChile",
+        "location": "Temuco, Chile",
+        "description": "Ingeniero de infraestructura para modernización tecnológica. Comunicación en español.",
+        "requirements": "4+ años experiencia, VMware, Ansible, Networking",
+        "employment_type": "Full-time", 
+        "seniority_level": "Senior",
+        "linkedin_job_id": "test-job-005",
+        "linkedin_url": "https://linkedin.com/jobs/test-005",
+        "requires_english": False,
+        "match_score": 0.75,
+        "is_active": True
+    }
+)
+
 @router.post("/seed-test-data")
 def create_test_data(db: Session = Depends(get_db)):
     """Create test data for frontend development and testing"""
     try:
-        # Check if test data already exists
-        existing_jobs = db.query(Job).filter(Job.title.like('%TEST%')).count()
-        if existing_jobs > 0:
-            return {"message": f"Test data already exists ({existing_jobs} test jobs found)"}
-        
-        # Sample test jobs
+        # Stamp the shared templates with a single timestamp
+        now = datetime.utcnow()
         test_jobs = [
-            {
-                "title": "DevOps Engineer - TEST",
-                "company": "TechCorp Chile",
-                "location": "Santiago, Chile",
-                "description": "Buscamos un DevOps Engineer con experiencia en AWS, Docker y Kubernetes. Trabajo remoto disponible.",
-                "requirements": "3+ años experiencia, Docker, Kubernetes, CI/CD",
-                "employment_type": "Full-time",
-                "seniority_level": "Mid-level",
-                "linkedin_job_id": "test-job-001",
-                "linkedin_url": "https://linkedin.com/jobs/test-001",
-                "requires_english": False,
-                "match_score": 0.95,
-                "posted_date": datetime.now(),
-                "is_active": True
-            },
-            {
-                "title": "Senior DevOps Engineer - TEST",
-                "company": "InnovaTech",
-                "location": "Valparaíso, Chile",
-                "description": "Empresa chilena busca Senior DevOps para liderar transformación digital. Excelente ambiente laboral.",
-                "requirements": "5+ años experiencia, AWS, Terraform, Python",
-                "employment_type": "Full-time",
-                "seniority_level": "Senior",
-                "linkedin_job_id": "test-job-002",
-                "linkedin_url": "https://linkedin.com/jobs/test-002",
-                "requires_english": False,
-                "match_score": 0.88,
-                "posted_date": datetime.now(),
-                "is_active": True
-            },
-            {
-                "title": "DevOps Specialist - TEST",
-                "company": "StartupChile",
-                "location": "Concepción, Chile", 
-                "description": "Startup innovadora busca DevOps para implementar infraestructura escalable. Sin requisito de inglés.",
-                "requirements": "2+ años experiencia, Git, Jenkins, Linux",
-                "employment_type": "Full-time",
-                "seniority_level": "Junior",
-                "linkedin_job_id": "test-job-003",
-                "linkedin_url": "https://linkedin.com/jobs/test-003",
-                "requires_english": False,
-                "match_score": 0.78,
-                "posted_date": datetime.now(),
-                "is_active": True
-            },
-            {
-                "title": "Platform Engineer - TEST",
-                "company": "CloudSolutions",
-                "location": "La Serena, Chile",
-                "description": "Ingeniero de plataforma para arquitectura cloud. Trabajo 100% en español.",
-                "requirements": "3+ años experiencia, GCP, Docker, Monitoring",
-                "employment_type": "Contract",
-                "seniority_level": "Mid-level",
-                "linkedin_job_id": "test-job-004",
-                "linkedin_url": "https://linkedin.com/jobs/test-004",
-                "requires_english": False,
-                "match_score": 0.82,
-                "posted_date": datetime.now(),
-                "is_active": True
-            },
-            {
-                "title": "Infrastructure Engineer - TEST",
-                "company": "DigitalChile",
-                "location": "Temuco, Chile",
-                "description": "Ingeniero de infraestructura para modernización tecnológica. Comunicación en español.",
-                "requirements": "4+ años experiencia, VMware, Ansible, Networking",
-                "employment_type": "Full-time", 
-                "seniority_level": "Senior",
-                "linkedin_job_id": "test-job-005",
-                "linkedin_url": "https://linkedin.com/jobs/test-005",
-                "requires_english": False,
-                "match_score": 0.75,
-                "posted_date": datetime.now(),
-                "is_active": True
-            }
+            {**template, "posted_date": now, "scraped_at": now}
+            for template in _TEST_JOB_TEMPLATES
         ]
         
-        # Add test jobs to database
-        created_jobs = []
-        for job_data in test_jobs:
-            job = Job(**job_data)
-            db.add(job)
-            created_jobs.append(job_data["title"])
-        
+        # Single INSERT that skips test jobs already stored (unique
+        # linkedin_job_id) instead of scanning titles for existing test data
+        created_ids = set(insert_new_jobs(db, test_jobs))
+        if not created_ids:
+            return {"message": "Test data already exists (all test jobs are already stored)"}
         db.commit()
+        _invalidate_job_caches()
         
         return {
             "message": "Test data created successfully",
-            "jobs_created": len(created_jobs),
-            "job_titles": created_jobs
+            "jobs_created": len(created_ids),
+            "job_titles": [job_data["title"] for job_data in test_jobs if job_data["linkedin_job_id"] in created_ids]
         }
         
     except Exception as e:
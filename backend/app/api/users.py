@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from app.database.database import get_db
 from app.models.models import User
 from app.api.auth import get_current_user
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 router = APIRouter()
@@ -19,8 +19,7 @@ class UserResponse(BaseModel):
     is_active: bool
     is_verified: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(
@@ -30,7 +29,7 @@ async def get_current_user_profile(
     return current_user
 
 @router.put("/me", response_model=UserResponse)
-async def update_user_profile(
+def update_user_profile(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -55,6 +54,7 @@ async def update_user_profile(
             
             current_user.email = user_update.email
         
+        # Committing drops the cached snapshot (auth_service Session listeners)
         db.commit()
         db.refresh(current_user)
         
@@ -3,7 +3,9 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.engine import Engine
 import os
+import atexit
 import logging
+import threading
 from dotenv import load_dotenv
 from google.cloud.sql.connector import Connector
 
@@ -19,13 +21,42 @@ DB_USER = os.getenv("DB_USER", "app_user")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "")
 DB_NAME = os.getenv("DB_NAME", "devops_jobs")
 
+# Direct PostgreSQL URL (docker-compose, Cloud SQL Auth Proxy or unix socket).
+# Served by psycopg2, whose C protocol implementation is much cheaper per query
+# than the pure-Python pg8000 driver the Cloud SQL Connector requires.
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+
+# Rows per multi-VALUES INSERT when bulk saving jobs
+BULK_PAGE_SIZE = 1000
+
+# Connection pool sizing (per process). Each uvicorn worker owns its own pool,
+# so the total number of Cloud SQL connections can reach
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW); keep that below max_connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+
 logger.info(f"Cloud SQL Connection: {INSTANCE_CONNECTION_NAME}")
 logger.info(f"Database: {DB_NAME}, User: {DB_USER}")
 
+# One Connector per process: it caches the instance metadata and ephemeral
+# certificate, so every pooled connection after the first skips that refresh.
+# Created on first use so SQLite / DATABASE_URL setups never start it.
+_connector = None
+_connector_lock = threading.Lock()
+
+def _get_connector() -> Connector:
+    """Return the shared Cloud SQL Connector, creating it on first use."""
+    global _connector
+    with _connector_lock:
+        if _connector is None:
+            _connector = Connector(refresh_strategy="lazy")
+            atexit.register(_connector.close)
+        return _connector
+
 def getconn():
     """Create a connection to Cloud SQL using the Cloud SQL Python Connector."""
-    connector = Connector()
-    conn = connector.connect(
+    conn = _get_connector().connect(
         INSTANCE_CONNECTION_NAME,
         "pg8000",
         user=DB_USER,
@@ -34,32 +65,49 @@ def getconn():
     )
     return conn
 
-# Create engine with Cloud SQL Connector or fallback to SQLite
-try:
-    # Check if we have Cloud SQL configuration
-    if INSTANCE_CONNECTION_NAME and DB_PASSWORD and not DB_PASSWORD == "":
+# Decide the backend once: Cloud SQL Connector when credentials are set,
+# then a direct PostgreSQL URL, otherwise SQLite
+USE_CLOUD_SQL = bool(INSTANCE_CONNECTION_NAME and DB_PASSWORD)
+USE_DATABASE_URL = DATABASE_URL.startswith("postgresql")
+
+def _build_engine(use_cloud_sql: bool, use_database_url: bool) -> Engine:
+    """Create the single engine for this process."""
+    if use_cloud_sql:
         logger.info("Using Cloud SQL Connector for PostgreSQL connection")
-        engine = create_engine(
+        return create_engine(
             "postgresql+pg8000://",
             creator=getconn,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
             pool_pre_ping=True,
             pool_recycle=300,
+            insertmanyvalues_page_size=BULK_PAGE_SIZE,
             echo=False
         )
-        logger.info("Cloud SQL PostgreSQL engine created successfully")
-    else:
-        raise Exception("Cloud SQL configuration incomplete - missing credentials")
-        
-except Exception as e:
-    logger.error(f"Failed to create Cloud SQL engine: {e}")
-    logger.info("Falling back to SQLite for development")
     
-    # SQLite fallback for development
-    engine = create_engine(
+    if use_database_url:
+        logger.info("Using direct PostgreSQL connection (psycopg2)")
+        return create_engine(
+            DATABASE_URL.replace("postgresql://", "postgresql+psycopg2://", 1),
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_pre_ping=True,
+            pool_recycle=300,
+            insertmanyvalues_page_size=BULK_PAGE_SIZE,
+            echo=False
+        )
+    
+    logger.warning("Cloud SQL configuration incomplete - falling back to SQLite for development")
+    return create_engine(
         "sqlite:///./devops_jobs.db",
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        insertmanyvalues_page_size=BULK_PAGE_SIZE
     )
-    logger.info("SQLite engine created successfully")
+
+engine = _build_engine(USE_CLOUD_SQL, USE_DATABASE_URL)
+logger.info(f"Database engine created: {engine.dialect.name}")
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
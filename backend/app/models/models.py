@@ -1,7 +1,12 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Float, Index, DDL, event, and_, inspect, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
+from sqlalchemy.schema import CreateIndex
 from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
@@ -16,8 +21,9 @@ class User(Base):
     is_verified = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     
-    # Relationship with job applications
-    job_applications = relationship("JobApplication", back_populates="user")
+    # Relationship with job applications. raise_on_sql: load explicitly with
+    # selectinload() where needed instead of an implicit per-object SELECT
+    job_applications = relationship("JobApplication", back_populates="user", lazy="raise_on_sql")
 
 class Job(Base):
     __tablename__ = "jobs"
@@ -46,7 +52,111 @@ class Job(Base):
     is_active = Column(Boolean, default=True)
     
     # Relationships
-    job_applications = relationship("JobApplication", back_populates="job")
+    job_applications = relationship("JobApplication", back_populates="job", lazy="raise_on_sql")
+
+# pg_trgm backs the ILIKE '%term%' search filters in GET /jobs/
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+_POSTGRESQL_ONLY_INDEXES = [
+    Index(
+        f"ix_jobs_{_column.key}_trgm",
+        _column,
+        postgresql_using="gin",
+        postgresql_ops={_column.key: "gin_trgm_ops"}
+    ).ddl_if(dialect="postgresql")
+    for _column in (Job.title, Job.description, Job.company, Job.location)
+]
+
+# Partial indexes matching the GET /jobs/ filter + ORDER BY posted_date DESC
+# NULLS LAST, id DESC. SQLite rejects NULLS LAST in an index but already sorts
+# NULLs last on DESC, so it gets the plain DESC form of the same index.
+_ACTIVE_POSTED_WHERE = {
+    "ix_jobs_active_posted_nulls_last": Job.is_active == True,
+    "ix_jobs_active_no_english_posted_nulls_last": and_(Job.is_active == True, Job.requires_english == False),
+}
+
+# Indexes no longer declared, dropped from existing databases: the NULLS FIRST
+# versions of the listing indexes above, and two btrees no query used
+# ((is_active, scraped_at), and (company, location), which cannot serve the
+# ILIKE '%x%' filters)
+_SUPERSEDED_JOB_INDEXES = (
+    "ix_jobs_active_posted", "ix_jobs_active_no_english_posted",
+    "ix_jobs_active_scraped", "ix_jobs_company_location",
+)
+
+_POSTGRESQL_ONLY_INDEXES += [
+    Index(_name, Job.posted_date.desc().nulls_last(), Job.id.desc(), postgresql_where=_where)
+    .ddl_if(dialect="postgresql")
+    for _name, _where in _ACTIVE_POSTED_WHERE.items()
+]
+
+_SQLITE_ONLY_INDEXES = [
+    Index(_name, Job.posted_date.desc(), Job.id.desc(), sqlite_where=_where)
+    .ddl_if(dialect="sqlite")
+    for _name, _where in _ACTIVE_POSTED_WHERE.items()
+]
+
+# Covering partial index for the total / no-English counts in /jobs/stats/summary
+Index(
+    "ix_jobs_active_requires_english",
+    Job.requires_english,
+    postgresql_where=Job.is_active == True,
+    postgresql_include=["id"],
+    sqlite_where=Job.is_active == True
+)
+
+# Partial index for the active-jobs GROUP BY company in /jobs/stats/summary
+Index(
+    "ix_jobs_active_company",
+    Job.company,
+    postgresql_where=Job.is_active == True,
+    sqlite_where=Job.is_active == True
+)
+
+
+def create_missing_job_indexes(bind):
+    """
+    Create the jobs indexes an existing table is missing.
+
+    create_all() only builds indexes together with a new table, so databases
+    created before an index was declared never get it. This is a one-off
+    maintenance task (create_job_indexes.py), not part of startup. On
+    PostgreSQL each index is built with CREATE INDEX CONCURRENTLY IF NOT
+    EXISTS in autocommit mode, so writes to jobs are not blocked while the
+    GIN indexes build. An index that fails is logged and skipped; drop it if
+    PostgreSQL left it INVALID and run the task again.
+    """
+    dialect = bind.dialect.name
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if dialect == "postgresql":
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        concurrently = "CONCURRENTLY " if dialect == "postgresql" else ""
+
+        existing = {index["name"] for index in inspect(conn).get_indexes(Job.__tablename__)}
+        for name in existing.intersection(_SUPERSEDED_JOB_INDEXES):
+            conn.execute(text(f"DROP INDEX {concurrently}IF EXISTS {name}"))
+
+        for index in Job.__table__.indexes:
+            if index.name in existing:
+                continue
+            if (index in _POSTGRESQL_ONLY_INDEXES and dialect != "postgresql") or \
+                    (index in _SQLITE_ONLY_INDEXES and dialect != "sqlite"):
+                continue
+            # Only for this statement: create_all() runs in a transaction,
+            # where PostgreSQL rejects CONCURRENTLY
+            options = index.dialect_options["postgresql"]
+            options["concurrently"] = True
+            try:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+                logger.info(f"Created index {index.name}")
+            except DBAPIError as e:
+                logger.warning(f"Could not create index {index.name}: {e}")
+            finally:
+                options["concurrently"] = False
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
@@ -59,8 +169,10 @@ class JobApplication(Base):
     applied_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
-    user = relationship("User", back_populates="job_applications")
-    job = relationship("Job", back_populates="job_applications")
+    user = relationship("User", back_populates="job_applications", lazy="raise_on_sql")
+    # Loaded in one extra IN query per batch of applications, so listing
+    # applications with their nested JobResponse never goes N+1
+    job = relationship("Job", back_populates="job_applications", lazy="selectin")
 
 class ScrapeLog(Base):
     __tablename__ = "scrape_logs"
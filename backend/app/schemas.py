@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 
@@ -39,8 +39,7 @@ class JobResponse(JobBase):
     scraped_at: datetime
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # User-related schemas
 class UserBase(BaseModel):
@@ -60,8 +59,7 @@ class UserResponse(UserBase):
     is_verified: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Auth schemas
 class Token(BaseModel):
@@ -90,8 +88,7 @@ class JobApplicationResponse(JobApplicationBase):
     applied_at: datetime
     job: JobResponse
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Scraping schemas
 class ScrapeJobsRequest(BaseModel):
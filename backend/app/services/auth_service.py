@@ -1,29 +1,91 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, bindparam, event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 from app.models.models import User
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+import bcrypt
+import jwt
 from datetime import datetime, timedelta
 import os
+import logging
+import threading
+from cachetools import TTLCache
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Token settings, read once at import instead of per AuthService instance
+DEFAULT_SECRET_KEY = "your-secret-key"
+SECRET_KEY = os.getenv("SECRET_KEY", DEFAULT_SECRET_KEY)
+ALGORITHM = os.getenv("ALGORITHM", "HS256")
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+# HMAC key bytes, encoded once instead of on every encode/decode
+_SECRET_BYTES = SECRET_KEY.encode("utf-8")
+
+if SECRET_KEY == DEFAULT_SECRET_KEY:
+    logger.warning("SECRET_KEY is not set; using the insecure default signing key")
+
+# bcrypt cost factor; matches passlib's default so existing hashes keep verifying
+BCRYPT_ROUNDS = 12
+
+# Column snapshots of authenticated users, keyed by email. Saves the user
+# SELECT on every authenticated request; entries expire after
+# USER_CACHE_TTL_SECONDS and are dropped as soon as a transaction that
+# updated or deleted the user commits (see the Session listeners below).
+USER_CACHE_TTL_SECONDS = 60
+_user_cache = TTLCache(maxsize=10000, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+
+# Built once so every lookup reuses the same compiled statement
+_USER_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+
+def invalidate_cached_user(email: str) -> None:
+    """Drop the cached snapshot for this email"""
+    with _user_cache_lock:
+        _user_cache.pop(email, None)
+
+# Emails of users changed in the current transaction, kept in Session.info
+_CHANGED_USER_EMAILS = "changed_user_emails"
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context):
+    """Remember every User updated/deleted through the ORM (deactivation,
+    password or profile changes), including its previous email"""
+    emails = session.info.setdefault(_CHANGED_USER_EMAILS, set())
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User):
+            emails.add(obj.email)
+            emails.update(e for e in inspect(obj).attrs.email.history.deleted if e)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session):
+    """Drop the snapshots once the change is visible to other sessions"""
+    for email in session.info.pop(_CHANGED_USER_EMAILS, ()):
+        invalidate_cached_user(email)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_users(session):
+    session.info.pop(_CHANGED_USER_EMAILS, None)
 
 class AuthService:
     def __init__(self, db: Session):
         self.db = db
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        self.secret_key = os.getenv("SECRET_KEY", "your-secret-key")
-        self.algorithm = os.getenv("ALGORITHM", "HS256")
-        self.access_token_expire_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        try:
+            return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+        except ValueError:
+            # Malformed or non-bcrypt hash stored for this user
+            return False
     
     def get_password_hash(self, password: str) -> str:
         """Hash a password"""
-        return self.pwd_context.hash(password)
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
     
     def get_user_by_email(self, email: str) -> User:
         """Get user by email"""
-        return self.db.query(User).filter(User.email == email).first()
+        return self.db.scalars(_USER_BY_EMAIL_STMT, {"email": email}).first()
     
     def authenticate_user(self, email: str, password: str) -> User:
         """Authenticate user with email and password"""
@@ -42,9 +104,16 @@ class AuthService:
             full_name=full_name
         )
         
+        # The flushed INSERT returns the id and applies the column defaults
+        # client-side. Detaching the user across the commit keeps that state,
+        # which the commit would otherwise expire at the cost of a refresh
+        # SELECT; the session's expire_on_commit stays on for everything else
         self.db.add(user)
+        self.db.flush()
+        self.db.expunge(user)
         self.db.commit()
-        self.db.refresh(user)
+        self.db.add(user)
+        invalidate_cached_user(email)
         
         return user
     
@@ -55,22 +124,40 @@ class AuthService:
         if expires_delta:
             expire = datetime.utcnow() + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+            expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        encoded_jwt = jwt.encode(to_encode, _SECRET_BYTES, algorithm=ALGORITHM)
         
         return encoded_jwt
     
     def get_current_user(self, token: str) -> User:
         """Get current user from JWT token"""
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(token, _SECRET_BYTES, algorithms=[ALGORITHM])
             email: str = payload.get("sub")
             if email is None:
                 return None
-        except JWTError:
+        except jwt.PyJWTError:
             return None
         
-        user = self.get_user_by_email(email)
-        return user
\ No newline at end of file
+        return self._get_cached_user_by_email(email)
+    
+    def _get_cached_user_by_email(self, email: str) -> User:
+        """Get user by email, served from the snapshot cache when possible"""
+        with _user_cache_lock:
+            snapshot = _user_cache.get(email)
+        
+        if snapshot is None:
+            user = self.get_user_by_email(email)
+            if user is not None:
+                snapshot = {c.key: getattr(user, c.key) for c in User.__table__.columns}
+                with _user_cache_lock:
+                    _user_cache[email] = snapshot
+            return user
+        
+        # Rebuild the row and attach it to this session without a SELECT, so
+        # callers can still modify and commit it
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return self.db.merge(user, load=False)
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+English Detection
+Detección de requisito de inglés en ofertas de trabajo
+"""
+
+import logging
+import os
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Keywords that mark a job as requiring English, matched case-insensitively as
+# plain substrings of the title and description. Whitespace tokens would miss
+# punctuated forms ("english," / "(bilingual)"), so the regex also covers the
+# single-word markers. IGNORECASE avoids building concatenated/lowercased copies.
+ENGLISH_KEYWORDS = (
+    'english', 'inglés', 'ingles', 'native english', 'fluent english',
+    'english speaking', 'english proficiency', 'bilingual',
+    'international team', 'global team', 'multinational'
+)
+# Plain alternation, also valid as a PostgreSQL ~* regex (see job_storage)
+ENGLISH_KEYWORDS_PATTERN = "|".join(map(re.escape, ENGLISH_KEYWORDS))
+_ENGLISH_KEYWORDS_RE = re.compile(ENGLISH_KEYWORDS_PATTERN, re.IGNORECASE)
+
+# Optional fastText language-id model (e.g. lid.176.ftz). When set and the
+# fasttext package is installed, postings classified as English with at least
+# LANGID_MIN_PROBABILITY are flagged too.
+LANGID_MODEL_PATH = os.getenv("LANGID_MODEL_PATH")
+LANGID_MIN_PROBABILITY = float(os.getenv("LANGID_MIN_PROBABILITY", "0.8"))
+_ENGLISH_LABEL = "__label__en"
+
+
+@lru_cache(maxsize=1)
+def _load_langid_model():
+    """Load the language-id model once, or None to use keywords only"""
+    if not LANGID_MODEL_PATH:
+        return None
+    try:
+        import fasttext
+        return fasttext.load_model(LANGID_MODEL_PATH)
+    except Exception as e:
+        logger.warning(f"Language-id model unavailable, using keywords only: {e}")
+        return None
+
+
+def langid_enabled() -> bool:
+    """True when language-id takes part in English detection"""
+    return _load_langid_model() is not None
+
+
+def _english_by_langid(jobs: List[Dict]) -> List[int]:
+    """Indexes of the jobs confidently classified as written in English"""
+    model = _load_langid_model()
+    if model is None or not jobs:
+        return []
+    # One predict call for the whole batch; fastText reads one line per text
+    texts = [f"{job['title'] or ''} {job['description'] or ''}".replace("\n", " ") for job in jobs]
+    labels, probabilities = model.predict(texts)
+    return [
+        index for index, (job_labels, job_probabilities) in enumerate(zip(labels, probabilities))
+        if job_labels[0] == _ENGLISH_LABEL and job_probabilities[0] >= LANGID_MIN_PROBABILITY
+    ]
+
+
+def requires_english(title: str, description: str) -> bool:
+    """Return True if the job title or description asks for English"""
+    job = {'title': title, 'description': description}
+    flag_english_requirements([job])
+    return job['requires_english']
+
+
+def flag_english_requirements(jobs: List[Dict]) -> None:
+    """
+    Set 'requires_english' on every job with one regex scan over the batch.
+
+    Titles and descriptions are joined with a separator no keyword contains,
+    and each match is mapped back to its job through the cumulative start
+    offsets (two texts per job). With a language-id model configured, jobs
+    whose text is confidently classified as English are flagged as well.
+    Every detection path (requires_english, the stored-flag refresh) goes
+    through here so they agree.
+    """
+    texts = [text or "" for job in jobs for text in (job['title'], job['description'])]
+    joined = "\x1f".join(texts)
+    starts = [0, *accumulate(len(text) + 1 for text in texts)]
+    hits = {(bisect_right(starts, match.start()) - 1) // 2 for match in _ENGLISH_KEYWORDS_RE.finditer(joined)}
+    hits.update(_english_by_langid(jobs))
+    for index, job in enumerate(jobs):
+        job['requires_english'] = index in hits
@@ -0,0 +1,106 @@
+"""
+Job Storage
+Helpers para persistir ofertas de trabajo en lote
+"""
+
+import logging
+from typing import List, Dict
+from sqlalchemy import insert, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.models.models import Job
+from app.database.database import BULK_PAGE_SIZE
+from app.services.english_detection import (
+    ENGLISH_KEYWORDS_PATTERN, flag_english_requirements, langid_enabled
+)
+
+logger = logging.getLogger(__name__)
+
+# Recompute requires_english for every stored job in one statement; only rows
+# whose flag actually changes are rewritten
+_REFRESH_ENGLISH_SQL = text("""
+    UPDATE jobs
+    SET requires_english = flags.requires_english
+    FROM (
+        SELECT id, coalesce(title ~* :pattern OR description ~* :pattern, false) AS requires_english
+        FROM jobs
+    ) AS flags
+    WHERE jobs.id = flags.id
+      AND jobs.requires_english IS DISTINCT FROM flags.requires_english
+""")
+
+
+def save_new_jobs(db: Session, jobs_data: List[Dict]) -> int:
+    """Insert the jobs not stored yet (see insert_new_jobs) and return how many were inserted"""
+    return len(insert_new_jobs(db, jobs_data))
+
+
+def insert_new_jobs(db: Session, jobs_data: List[Dict]) -> List[str]:
+    """
+    Insert only the jobs whose linkedin_job_id is not stored yet.
+
+    Uses INSERT ... ON CONFLICT (linkedin_job_id) DO NOTHING on PostgreSQL and
+    INSERT OR IGNORE on SQLite as an executemany, so the database dedupes
+    against stored rows atomically without a prior SELECT. The engine's
+    insertmanyvalues batching pages the rows (BULK_PAGE_SIZE per statement),
+    and rows with different key sets are grouped instead of being forced
+    into the first row's columns. Repeats inside jobs_data are dropped in
+    memory first. Returns the linkedin_job_id of each row actually inserted
+    (via RETURNING, in no particular order); the caller commits.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = pg_insert(Job).on_conflict_do_nothing(index_elements=["linkedin_job_id"])
+    else:
+        stmt = insert(Job).prefix_with("OR IGNORE")
+
+    # Drop repeats within the batch (e.g. the same posting on two result
+    # pages) before they are sent; first occurrence wins
+    unique_jobs = {}
+    for job in jobs_data:
+        unique_jobs.setdefault(job['linkedin_job_id'], job)
+    jobs_data = list(unique_jobs.values())
+
+    if not jobs_data:
+        return []
+    # Skipped conflicts return no row, so RETURNING lists only new jobs
+    return db.execute(stmt.returning(Job.linkedin_job_id), jobs_data).scalars().all()
+
+
+def refresh_english_requirements(db: Session) -> int:
+    """
+    Re-run English detection over the stored jobs (e.g. after the keyword
+    list changes) and return how many flags changed.
+
+    On PostgreSQL with keyword-only detection this is a single UPDATE using
+    ENGLISH_KEYWORDS_PATTERN as a case-insensitive regex, so no rows travel
+    to Python. Otherwise (other databases, or a language-id model that SQL
+    cannot apply) the jobs are scanned once with flag_english_requirements,
+    the same detector used at scrape time, and only changed flags are
+    written back. The caller commits.
+    """
+    if db.get_bind().dialect.name == "postgresql" and not langid_enabled():
+        return db.execute(_REFRESH_ENGLISH_SQL, {"pattern": ENGLISH_KEYWORDS_PATTERN}).rowcount
+
+    rows = db.execute(select(Job.id, Job.title, Job.description, Job.requires_english)).all()
+    jobs = [{'title': row.title, 'description': row.description} for row in rows]
+    flag_english_requirements(jobs)
+    changed = [
+        {'id': row.id, 'requires_english': job['requires_english']}
+        for row, job in zip(rows, jobs)
+        if row.requires_english != job['requires_english']
+    ]
+    for start in range(0, len(changed), BULK_PAGE_SIZE):
+        db.execute(update(Job), changed[start:start + BULK_PAGE_SIZE])
+    return len(changed)
+
+
+if __name__ == "__main__":
+    # Maintenance task, run from backend/: python -m app.services.job_storage
+    # Running API workers pick up the new flags when their 60s caches expire
+    from app.database.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    with SessionLocal() as db:
+        updated = refresh_english_requirements(db)
+        db.commit()
+    logger.info(f"English requirement flags refreshed on {updated} jobs")
@@ -4,17 +4,22 @@ Servicio para interactuar con la API oficial de LinkedIn
 """
 
 import os
+import uuid
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from linkedin_api import Linkedin
-from app.models.models import Job
-from app.database.database import get_db
+from app.services.job_storage import save_new_jobs
+from app.services.english_detection import requires_english
+from app.services.linkedin_http import create_pooled_adapter
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Concurrent job detail fetches per search (below the shared HTTP_POOL_SIZE)
+DETAIL_FETCH_WORKERS = 10
+
 class LinkedInAPIService:
     """Service for interacting with LinkedIn API"""
     
@@ -33,6 +38,9 @@ class LinkedInAPIService:
         try:
             logger.info("🔑 Iniciando sesión en LinkedIn API...")
             self.api = Linkedin(email, password)
+            # Keep enough pooled keep-alive connections for the concurrent
+            # get_job calls so each detail fetch reuses a TLS connection
+            self.api.client.session.mount("https://", create_pooled_adapter())
             self.logged_in = True
             logger.info("✅ Login exitoso en LinkedIn API")
             return True
@@ -51,6 +59,7 @@ class LinkedInAPIService:
             return self._generate_sample_jobs_api(keywords, location)
         
         try:
+            now = datetime.utcnow()
             logger.info(f"🔍 Buscando trabajos en LinkedIn API: {keywords} en {location}")
             
             # Get job search results using the API
@@ -60,11 +69,14 @@ class LinkedInAPIService:
                 limit=limit
             )
             
+            # Each job needs its own get_job detail request; run them concurrently
+            with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as pool:
+                processed = list(pool.map(lambda job: self._process_job_from_api(job, now), jobs))
+            
             processed_jobs = []
             
-            for job in jobs:
+            for job_data in processed:
                 try:
-                    job_data = self._process_job_from_api(job)
                     if job_data:
                         # Check English requirement
                         job_data['requires_english'] = self._check_english_requirement_api(job_data)
@@ -81,8 +93,8 @@ class LinkedInAPIService:
             logger.error(f"Error en búsqueda de LinkedIn API: {e}")
             return self._generate_sample_jobs_api(keywords, location)
     
-    def _process_job_from_api(self, job: Dict) -> Optional[Dict]:
-        """Process job data from LinkedIn API response"""
+    def _process_job_from_api(self, job: Dict, now: datetime) -> Optional[Dict]:
+        """Process job data from LinkedIn API response, stamped with the batch time"""
         try:
             # Extract job information from API response
             job_id = job.get('trackingUrn', '').split(':')[-1] if job.get('trackingUrn') else ''
@@ -116,9 +128,10 @@ class LinkedInAPIService:
                 'company': company_name,
                 'location': location_info,
                 'description': description[:1000],  # Limit description length
-                'linkedin_job_id': job_id or f"api_{int(datetime.utcnow().timestamp())}",
+                'linkedin_job_id': job_id or f"api_{uuid.uuid4().hex}",
                 'linkedin_url': linkedin_url,
-                'posted_date': datetime.utcnow(),
+                'posted_date': now,
+                'scraped_at': now,
                 'salary_range': self._extract_salary(job_details),
                 'employment_type': job_details.get('employmentType', 'Full-time') if job_details else 'Full-time',
                 'seniority_level': job_details.get('seniorityLevel', 'Mid Level') if job_details else 'Mid Level'
@@ -149,23 +162,13 @@ class LinkedInAPIService:
     
     def _check_english_requirement_api(self, job_data: Dict) -> bool:
         """Check if job requires English"""
-        text_to_check = f"{job_data['title']} {job_data['description']}".lower()
-        
-        english_keywords = [
-            'english', 'inglés', 'ingles', 'native english', 'fluent english',
-            'english speaking', 'english proficiency', 'bilingual',
-            'international team', 'global team', 'multinational'
-        ]
-        
-        for keyword in english_keywords:
-            if keyword in text_to_check:
-                return True
-        
-        return False
+        return requires_english(job_data['title'], job_data['description'])
     
     def _generate_sample_jobs_api(self, keywords: str, location: str) -> List[Dict]:
         """Generate sample jobs when API is not available"""
         logger.warning("Generando trabajos de muestra (API no disponible)")
+        now = datetime.utcnow()
+        ts = int(now.timestamp())
         
         sample_jobs = [
             {
@@ -173,9 +176,10 @@ class LinkedInAPIService:
                 'company': 'TechCorp Chile',
                 'location': location,
                 'description': f'Buscamos {keywords} Engineer para liderar iniciativas de infraestructura cloud. AWS, Kubernetes, CI/CD.',
-                'linkedin_job_id': f'sample_api_1_{int(datetime.utcnow().timestamp())}',
+                'linkedin_job_id': f'sample_api_1_{ts}',
                 'linkedin_url': 'https://linkedin.com/jobs/view/sample1',
-                'posted_date': datetime.utcnow() - timedelta(days=1),
+                'posted_date': now - timedelta(days=1),
+                'scraped_at': now,
                 'salary_range': 'CLP 2,500,000 - 3,500,000',
                 'employment_type': 'Full-time',
                 'seniority_level': 'Senior',
@@ -186,9 +190,10 @@ class LinkedInAPIService:
                 'company': 'StartupTech',
                 'location': location,
                 'description': f'Especialista en {keywords} para proyectos de transformación digital. Docker, Terraform, monitoring.',
-                'linkedin_job_id': f'sample_api_2_{int(datetime.utcnow().timestamp())}',
+                'linkedin_job_id': f'sample_api_2_{ts}',
                 'linkedin_url': 'https://linkedin.com/jobs/view/sample2',
-                'posted_date': datetime.utcnow() - timedelta(days=2),
+                'posted_date': now - timedelta(days=2),
+                'scraped_at': now,
                 'salary_range': 'CLP 2,000,000 - 2,800,000',
                 'employment_type': 'Full-time',
                 'seniority_level': 'Mid Level',
@@ -199,9 +204,10 @@ class LinkedInAPIService:
                 'company': 'Banco Digital Chile',
                 'location': location,
                 'description': f'{keywords} SRE para plataforma financiera. Alta disponibilidad, Kubernetes, Prometheus.',
-                'linkedin_job_id': f'sample_api_3_{int(datetime.utcnow().timestamp())}',
+                'linkedin_job_id': f'sample_api_3_{ts}',
                 'linkedin_url': 'https://linkedin.com/jobs/view/sample3',
-                'posted_date': datetime.utcnow() - timedelta(days=3),
+                'posted_date': now - timedelta(days=3),
+                'scraped_at': now,
                 'salary_range': 'CLP 3,000,000 - 4,000,000',
                 'employment_type': 'Full-time',
                 'seniority_level': 'Senior',
@@ -212,9 +218,10 @@ class LinkedInAPIService:
                 'company': 'E-commerce Chile',
                 'location': location,
                 'description': f'Platform Engineer especializado en {keywords}. Microservicios, API Gateway, observabilidad.',
-                'linkedin_job_id': f'sample_api_4_{int(datetime.utcnow().timestamp())}',
+                'linkedin_job_id': f'sample_api_4_{ts}',
                 'linkedin_url': 'https://linkedin.com/jobs/view/sample4',
-                'posted_date': datetime.utcnow() - timedelta(days=4),
+                'posted_date': now - timedelta(days=4),
+                'scraped_at': now,
                 'salary_range': 'CLP 2,200,000 - 3,200,000',
                 'employment_type': 'Full-time',
                 'seniority_level': 'Mid Level',
@@ -225,9 +232,10 @@ class LinkedInAPIService:
                 'company': 'FinTech Innovación',
                 'location': location,
                 'description': f'{keywords} automation engineer. Infrastructure as Code, GitOps, seguridad.',
-                'linkedin_job_id': f'sample_api_5_{int(datetime.utcnow().timestamp())}',
+                'linkedin_job_id': f'sample_api_5_{ts}',
                 'linkedin_url': 'https://linkedin.com/jobs/view/sample5',
-                'posted_date': datetime.utcnow() - timedelta(days=5),
+                'posted_date': now - timedelta(days=5),
+                'scraped_at': now,
                 'salary_range': 'CLP 2,800,000 - 3,800,000',
                 'employment_type': 'Full-time',
                 'seniority_level': 'Senior',
@@ -238,43 +246,27 @@ class LinkedInAPIService:
         logger.info(f"📝 Generados {len(sample_jobs)} trabajos de muestra via API")
         return sample_jobs
     
-    def save_jobs_to_database(self, jobs_data: List[Dict]) -> int:
-        """Save jobs to database"""
-        db = next(get_db())
+    def save_jobs_to_database(self, jobs_data: List[Dict], db: Session) -> int:
+        """Save jobs to database using the caller's session"""
         saved_count = 0
         
         try:
-            for job_data in jobs_data:
-                try:
-                    # Check if job already exists
-                    existing_job = db.query(Job).filter(
-                        Job.linkedin_job_id == job_data['linkedin_job_id']
-                    ).first()
-                    
-                    if not existing_job:
-                        job = Job(**job_data)
-                        db.add(job)
-                        saved_count += 1
-                except Exception as e:
-                    logger.error(f"Error guardando trabajo: {e}")
-                    continue
-            
+            saved_count = save_new_jobs(db, jobs_data)
             db.commit()
             logger.info(f"✅ Guardados {saved_count} trabajos en base de datos")
             
         except Exception as e:
             db.rollback()
+            saved_count = 0
             logger.error(f"Error en commit de trabajos: {e}")
-        finally:
-            db.close()
             
         return saved_count
 
 # Función de utilidad para búsqueda rápida
-def search_linkedin_jobs_api(email: str, password: str, keywords: str = "DevOps", 
+def search_linkedin_jobs_api(email: str, password: str, db: Session, keywords: str = "DevOps", 
                            location: str = "Chile", limit: int = 50) -> Dict:
     """
-    Quick function to search LinkedIn jobs using API
+    Quick function to search LinkedIn jobs using API and save them with db
     """
     try:
         service = LinkedInAPIService(email, password)
@@ -287,7 +279,7 @@ def search_linkedin_jobs_api(email: str, password: str, keywords: str = "DevOps"
             }
         
         jobs = service.search_jobs(keywords, location, limit)
-        saved_count = service.save_jobs_to_database(jobs)
+        saved_count = service.save_jobs_to_database(jobs, db)
         
         return {
             'success': True,
@@ -0,0 +1,55 @@
+"""
+LinkedIn HTTP Client
+Cliente HTTP compartido para las llamadas a LinkedIn
+"""
+
+import atexit
+import threading
+from typing import Optional
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+HTTP_TIMEOUT_SECONDS = 10.0
+# Keep-alive connections kept per host by the sync (requests) pools
+HTTP_POOL_SIZE = 20
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+_guest_session: Optional[requests.Session] = None
+_guest_session_lock = threading.Lock()
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled async HTTP client shared by the LinkedIn services"""
+    # HTTP/2 multiplexes concurrent LinkedIn requests (e.g. the OAuth search
+    # pages) over a single connection per host
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=HTTP_TIMEOUT_SECONDS,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+
+
+def create_pooled_adapter() -> HTTPAdapter:
+    """HTTPAdapter sized for the concurrent LinkedIn requests of one search"""
+    return HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+
+
+def get_guest_session() -> requests.Session:
+    """
+    Process-wide requests session for LinkedIn's public guest endpoints.
+
+    Every scraper shares its connection pool, so DNS lookups and TLS
+    handshakes to www.linkedin.com happen once per process instead of once
+    per LinkedInScraper instance.
+    """
+    global _guest_session
+    if _guest_session is None:
+        with _guest_session_lock:
+            if _guest_session is None:
+                session = requests.Session()
+                session.headers.update({"User-Agent": USER_AGENT})
+                session.mount("https://", create_pooled_adapter())
+                atexit.register(session.close)
+                _guest_session = session
+    return _guest_session
@@ -4,44 +4,75 @@ Servicio para autenticación OAuth con LinkedIn usando Google OAuth
 """
 
 import os
+import asyncio
 import logging
 import secrets
-import json
+import uuid
+import orjson
+from functools import lru_cache
+from urllib.parse import urlencode
 from typing import Dict, Optional
 from datetime import datetime, timedelta
-from authlib.integrations.requests_client import OAuth2Session
-import requests
+import httpx
+from fastapi import Request
+from dotenv import load_dotenv
+from cachetools import TTLCache
+from app.services.english_detection import requires_english
+
+load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# LinkedIn OAuth provider, resolved once at import
+LINKEDIN_AUTHORIZATION_URL = 'https://www.linkedin.com/oauth/v2/authorization'
+LINKEDIN_TOKEN_URL = 'https://www.linkedin.com/oauth/v2/accessToken'
+LINKEDIN_PROFILE_URL = 'https://api.linkedin.com/v2/userinfo'
+LINKEDIN_JOBS_URL = 'https://api.linkedin.com/rest/jobSearches'
+
+LINKEDIN_CLIENT_ID = os.getenv('LINKEDIN_CLIENT_ID')
+LINKEDIN_CLIENT_SECRET = os.getenv('LINKEDIN_CLIENT_SECRET')
+LINKEDIN_REDIRECT_URI = os.getenv('LINKEDIN_REDIRECT_URI', 'http://localhost:3000/auth/linkedin/callback')
+OAUTH_CREDENTIALS_CONFIGURED = bool(LINKEDIN_CLIENT_ID and LINKEDIN_CLIENT_SECRET and
+                                    LINKEDIN_CLIENT_ID != 'your_linkedin_app_id')
+
+# OAuth scopes for job search
+OAUTH_SCOPE = ['openid', 'profile', 'email', 'w_member_social']
+
+# Userinfo responses keyed by access token; a token always maps to the same
+# member, so repeated profile lookups within the TTL skip the HTTPS call
+PROFILE_CACHE_TTL_SECONDS = 180
+_profile_cache = TTLCache(maxsize=1024, ttl=PROFILE_CACHE_TTL_SECONDS)
+# In-flight userinfo fetches, one task per token; removed when the task finishes
+_profile_fetches: Dict[str, asyncio.Task] = {}
+
+# Maximum jobs LinkedIn returns per jobSearches request, and the cap on
+# concurrent pages a single search may fan out to
+OAUTH_PAGE_SIZE = 50
+OAUTH_MAX_PAGES = 4
+
 class LinkedInOAuthService:
-    """Service for LinkedIn OAuth authentication"""
+    """
+    Service for LinkedIn OAuth authentication
+
+    Stateless: access tokens are passed per call, so one instance is shared
+    by every request.
+    """
     
-    def __init__(self):
-        # LinkedIn OAuth endpoints
-        self.authorization_base_url = 'https://www.linkedin.com/oauth/v2/authorization'
-        self.token_url = 'https://www.linkedin.com/oauth/v2/accessToken'
-        self.profile_url = 'https://api.linkedin.com/v2/userinfo'
-        self.jobs_url = 'https://api.linkedin.com/rest/jobSearches'
-        
-        # Load environment variables
-        from dotenv import load_dotenv
-        load_dotenv()
-        
-        # OAuth credentials from environment
-        self.client_id = os.getenv('LINKEDIN_CLIENT_ID')
-        self.client_secret = os.getenv('LINKEDIN_CLIENT_SECRET')
-        self.redirect_uri = os.getenv('LINKEDIN_REDIRECT_URI', 'http://localhost:3000/auth/linkedin/callback')
-        
-        # Check if credentials are configured
-        self.credentials_configured = bool(self.client_id and self.client_secret and 
-                                         self.client_id != 'your_linkedin_app_id')
-        
-        # OAuth scopes for job search
-        self.scope = ['openid', 'profile', 'email', 'w_member_social']
+    def __init__(self, http: Optional[httpx.AsyncClient] = None):
+        # Shared pooled HTTP client (see app.services.linkedin_http)
+        self.http = http
         
-        self.access_token = None
-        self.token_expires_at = None
+        # LinkedIn OAuth endpoints and credentials (module-level provider config)
+        self.authorization_base_url = LINKEDIN_AUTHORIZATION_URL
+        self.token_url = LINKEDIN_TOKEN_URL
+        self.profile_url = LINKEDIN_PROFILE_URL
+        self.jobs_url = LINKEDIN_JOBS_URL
+        self.client_id = LINKEDIN_CLIENT_ID
+        self.client_secret = LINKEDIN_CLIENT_SECRET
+        self.redirect_uri = LINKEDIN_REDIRECT_URI
+        self.credentials_configured = OAUTH_CREDENTIALS_CONFIGURED
+        self.scope = OAUTH_SCOPE
+
         
     def get_authorization_url(self) -> Dict[str, str]:
         """
@@ -65,17 +96,14 @@ class LinkedInOAuthService:
             # Generate state for CSRF protection
             state = secrets.token_urlsafe(32)
             
-            # Create OAuth2 session
-            linkedin = OAuth2Session(
-                client_id=self.client_id,
-                redirect_uri=self.redirect_uri,
-                scope=self.scope
-            )
-            
-            authorization_url, state = linkedin.create_authorization_url(
-                self.authorization_base_url,
-                state=state
-            )
+            # Plain query string built directly
+            authorization_url = f"{self.authorization_base_url}?" + urlencode({
+                'response_type': 'code',
+                'client_id': self.client_id,
+                'redirect_uri': self.redirect_uri,
+                'scope': ' '.join(self.scope),
+                'state': state
+            })
             
             logger.info("✅ Authorization URL generated successfully")
             
@@ -98,32 +126,29 @@ class LinkedInOAuthService:
                 'state': None
             }
     
-    def get_access_token_from_code(self, authorization_code: str, state: str) -> Dict:
+    async def get_access_token_from_code(self, authorization_code: str, state: str) -> Dict:
         """
         Exchange authorization code for access token
         """
         try:
-            # Create OAuth2 session
-            linkedin = OAuth2Session(
-                client_id=self.client_id,
-                redirect_uri=self.redirect_uri
-            )
-            
-            # Exchange code for token
-            token = linkedin.fetch_token(
-                self.token_url,
-                authorization_response=f"{self.redirect_uri}?code={authorization_code}&state={state}",
-                client_secret=self.client_secret
-            )
+            # One form-encoded POST over the shared client; LinkedIn takes the
+            # client credentials in the body
+            response = await self.http.post(self.token_url, data={
+                'grant_type': 'authorization_code',
+                'code': authorization_code,
+                'redirect_uri': self.redirect_uri,
+                'client_id': self.client_id,
+                'client_secret': self.client_secret
+            })
+            response.raise_for_status()
+            token = orjson.loads(response.content)
             
-            self.access_token = token['access_token']
-            self.token_expires_at = datetime.utcnow() + timedelta(seconds=token.get('expires_in', 3600))
             
             logger.info("✅ Access token obtained successfully")
             
             return {
                 'success': True,
-                'access_token': self.access_token,
+                'access_token': token['access_token'],
                 'expires_in': token.get('expires_in', 3600),
                 'message': 'Authentication successful'
             }
@@ -136,31 +161,47 @@ class LinkedInOAuthService:
                 'message': 'Failed to get access token'
             }
     
-    def get_user_profile(self) -> Dict:
+    async def get_user_profile(self, access_token: Optional[str]) -> Dict:
         """
-        Get user profile information
+        Get user profile information for the given access token
         """
-        if not self.access_token:
+        if not access_token:
             return {
                 'success': False,
                 'error': 'No access token available',
                 'profile': None
             }
         
+        token = access_token
+        cached = _profile_cache.get(token)
+        if cached is not None:
+            return cached
+        
+        # Concurrent calls for the same token await a single userinfo request
+        task = _profile_fetches.get(token)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_profile(token))
+            _profile_fetches[token] = task
+            task.add_done_callback(lambda _: _profile_fetches.pop(token, None))
+        # shield: a cancelled caller must not cancel the fetch others await
+        return await asyncio.shield(task)
+    
+    async def _fetch_profile(self, token: str) -> Dict:
+        """Call /v2/userinfo and cache the result when it succeeds"""
         try:
             headers = {
-                'Authorization': f'Bearer {self.access_token}',
+                'Authorization': f'Bearer {token}',
                 'Content-Type': 'application/json'
             }
             
-            response = requests.get(self.profile_url, headers=headers)
+            response = await self.http.get(self.profile_url, headers=headers)
             response.raise_for_status()
             
-            profile_data = response.json()
+            profile_data = orjson.loads(response.content)
             
             logger.info(f"✅ Profile retrieved: {profile_data.get('name', 'Unknown')}")
             
-            return {
+            result = {
                 'success': True,
                 'profile': {
                     'name': profile_data.get('name', ''),
@@ -169,6 +210,8 @@ class LinkedInOAuthService:
                     'linkedin_id': profile_data.get('sub', '')
                 }
             }
+            _profile_cache[token] = result
+            return result
             
         except Exception as e:
             logger.error(f"Error getting user profile: {e}")
@@ -178,46 +221,60 @@ class LinkedInOAuthService:
                 'profile': None
             }
     
-    def search_jobs_oauth(self, keywords: str = "DevOps", location: str = "Chile", limit: int = 50) -> Dict:
+    async def search_jobs_oauth(self, access_token: Optional[str], keywords: str = "DevOps",
+                                location: str = "Chile", limit: int = 50) -> Dict:
         """
-        Search jobs using LinkedIn API with OAuth token
+        Search jobs using LinkedIn API with the given OAuth token
         """
-        if not self.access_token:
+        if not access_token:
             logger.warning("No access token available, using sample data")
             return self._generate_oauth_sample_jobs(keywords, location, limit)
         
         try:
             headers = {
-                'Authorization': f'Bearer {self.access_token}',
+                'Authorization': f'Bearer {access_token}',
                 'Content-Type': 'application/json',
                 'LinkedIn-Version': '202304'
             }
             
-            # LinkedIn Job Search API parameters
-            params = {
-                'keywords': keywords,
-                'locationFallback': location,
-                'count': min(limit, 50),  # LinkedIn API limit
-                'start': 0
-            }
+            # LinkedIn returns at most 50 jobs per request; fetch every page
+            # needed for `limit` concurrently over the shared client
+            pages = [
+                {
+                    'keywords': keywords,
+                    'locationFallback': location,
+                    'count': min(OAUTH_PAGE_SIZE, limit - start),
+                    'start': start
+                }
+                for start in range(0, min(limit, OAUTH_PAGE_SIZE * OAUTH_MAX_PAGES), OAUTH_PAGE_SIZE)
+            ]
+            responses = await asyncio.gather(
+                *(self.http.get(self.jobs_url, headers=headers, params=params) for params in pages),
+                return_exceptions=True
+            )
             
-            response = requests.get(self.jobs_url, headers=headers, params=params)
+            processed_jobs = []
+            pages_ok = 0
+            for response in responses:
+                if isinstance(response, Exception):
+                    logger.warning(f"LinkedIn API page request failed: {response}")
+                elif response.status_code != 200:
+                    logger.warning(f"LinkedIn API returned status {response.status_code}")
+                else:
+                    pages_ok += 1
+                    processed_jobs.extend(self._process_linkedin_jobs_oauth(orjson.loads(response.content)))
             
-            if response.status_code == 200:
-                jobs_data = response.json()
-                processed_jobs = self._process_linkedin_jobs_oauth(jobs_data)
-                
-                logger.info(f"✅ Found {len(processed_jobs)} jobs via LinkedIn OAuth API")
-                
-                return {
-                    'success': True,
-                    'jobs_found': len(processed_jobs),
-                    'jobs': processed_jobs,
-                    'source': 'linkedin_oauth_api'
-                }
-            else:
-                logger.warning(f"LinkedIn API returned status {response.status_code}")
+            if not pages_ok:
                 return self._generate_oauth_sample_jobs(keywords, location, limit)
+            
+            logger.info(f"✅ Found {len(processed_jobs)} jobs via LinkedIn OAuth API")
+            
+            return {
+                'success': True,
+                'jobs_found': len(processed_jobs),
+                'jobs': processed_jobs,
+                'source': 'linkedin_oauth_api'
+            }
                 
         except Exception as e:
             logger.error(f"Error searching jobs via OAuth: {e}")
@@ -226,28 +283,12 @@ class LinkedInOAuthService:
     def _process_linkedin_jobs_oauth(self, jobs_data: Dict) -> list:
         """Process job data from LinkedIn OAuth API response"""
         processed_jobs = []
+        now = datetime.utcnow()
         
         try:
-            elements = jobs_data.get('elements', [])
-            
-            for job in elements:
+            for job in jobs_data.get('elements', []):
                 try:
-                    job_info = {
-                        'title': job.get('title', 'DevOps Engineer'),
-                        'company': job.get('companyName', 'Tech Company'),
-                        'location': job.get('location', 'Chile'),
-                        'description': job.get('description', 'DevOps position with modern technologies')[:500],
-                        'linkedin_job_id': str(job.get('jobPostingId', f"oauth_{int(datetime.utcnow().timestamp())}")),
-                        'linkedin_url': job.get('jobPostingUrl', 'https://linkedin.com/jobs'),
-                        'posted_date': datetime.utcnow(),
-                        'salary_range': self._extract_salary_oauth(job),
-                        'employment_type': job.get('employmentType', 'Full-time'),
-                        'seniority_level': job.get('seniorityLevel', 'Mid Level'),
-                        'requires_english': self._check_english_oauth(job)
-                    }
-                    
-                    processed_jobs.append(job_info)
-                    
+                    processed_jobs.append(self._build_job_info(job, now))
                 except Exception as e:
                     logger.error(f"Error processing individual job: {e}")
                     continue
@@ -257,6 +298,22 @@ class LinkedInOAuthService:
             
         return processed_jobs
     
+    def _build_job_info(self, job: Dict, now: datetime) -> Dict:
+        """Map one element of a jobSearches response to a job dict stamped with now"""
+        return {
+            'title': job.get('title', 'DevOps Engineer'),
+            'company': job.get('companyName', 'Tech Company'),
+            'location': job.get('location', 'Chile'),
+            'description': job.get('description', 'DevOps position with modern technologies')[:500],
+            'linkedin_job_id': str(job.get('jobPostingId') or f"oauth_{uuid.uuid4().hex}"),
+            'linkedin_url': job.get('jobPostingUrl', 'https://linkedin.com/jobs'),
+            'posted_date': now,
+            'salary_range': self._extract_salary_oauth(job),
+            'employment_type': job.get('employmentType', 'Full-time'),
+            'seniority_level': job.get('seniorityLevel', 'Mid Level'),
+            'requires_english': self._check_english_oauth(job)
+        }
+    
     def _extract_salary_oauth(self, job: Dict) -> Optional[str]:
         """Extract salary information from OAuth job data"""
         try:
@@ -276,22 +333,15 @@ class LinkedInOAuthService:
     def _check_english_oauth(self, job: Dict) -> bool:
         """Check if job requires English from OAuth data"""
         try:
-            text_to_check = f"{job.get('title', '')} {job.get('description', '')}".lower()
-            
-            english_keywords = [
-                'english', 'inglés', 'ingles', 'native english', 'fluent english',
-                'english speaking', 'english proficiency', 'bilingual',
-                'international team', 'global team', 'multinational'
-            ]
-            
-            return any(keyword in text_to_check for keyword in english_keywords)
-            
+            return requires_english(job.get('title', ''), job.get('description', ''))
         except Exception:
             return False
     
     def _generate_oauth_sample_jobs(self, keywords: str, location: str, limit: int) -> Dict:
         """Generate sample jobs when OAuth API is not available"""
         logger.warning("Generating OAuth sample data (API not available)")
+        now = datetime.utcnow()
+        ts = int(now.timestamp())
         
         sample_jobs = [
             {
@@ -299,9 +349,9 @@ class LinkedInOAuthService:
                 'company': 'TechCorp OAuth',
                 'location': location,
                 'description': f'OAuth authenticated search for {keywords}. AWS, Kubernetes, CI/CD pipelines.',
-                'linkedin_job_id': f'oauth_sample_1_{int(datetime.utcnow().timestamp())}',
+                'linkedin_job_id': f'oauth_sample_1_{ts}',
                 'linkedin_url': 'https://linkedin.com/jobs/view/oauth1',
-                'posted_date': datetime.utcnow() - timedelta(days=1),
+                'posted_date': now - timedelta(days=1),
                 'salary_range': 'CLP 3,000,000 - 4,200,000',
                 'employment_type': 'Full-time',
                 'seniority_level': 'Senior',
@@ -312,9 +362,9 @@ class LinkedInOAuthService:
                 'company': 'StartupTech OAuth',
                 'location': location,
                 'description': f'OAuth {keywords} position. Terraform, Docker, microservices architecture.',
-                'linkedin_job_id': f'oauth_sample_2_{int(datetime.utcnow().timestamp())}',
+                'linkedin_job_id': f'oauth_sample_2_{ts}',
                 'linkedin_url': 'https://linkedin.com/jobs/view/oauth2',
-                'posted_date': datetime.utcnow() - timedelta(days=2),
+                'posted_date': now - timedelta(days=2),
                 'salary_range': 'CLP 2,500,000 - 3,500,000',
                 'employment_type': 'Full-time',
                 'seniority_level': 'Mid Level',
@@ -325,9 +375,9 @@ class LinkedInOAuthService:
                 'company': 'FinTech OAuth',
                 'location': location,
                 'description': f'OAuth authenticated {keywords} role. GitOps, monitoring, security.',
-                'linkedin_job_id': f'oauth_sample_3_{int(datetime.utcnow().timestamp())}',
+                'linkedin_job_id': f'oauth_sample_3_{ts}',
                 'linkedin_url': 'https://linkedin.com/jobs/view/oauth3',
-                'posted_date': datetime.utcnow() - timedelta(days=3),
+                'posted_date': now - timedelta(days=3),
                 'salary_range': 'CLP 3,200,000 - 4,500,000',
                 'employment_type': 'Full-time',
                 'seniority_level': 'Senior',
@@ -346,8 +396,13 @@ class LinkedInOAuthService:
         }
 
 # Utility functions
+def get_oauth_service(request: Request) -> LinkedInOAuthService:
+    """FastAPI dependency returning the shared service created in the app lifespan"""
+    return request.app.state.linkedin_oauth
+
+@lru_cache(maxsize=1)
 def create_oauth_service() -> LinkedInOAuthService:
-    """Create and return LinkedIn OAuth service instance"""
+    """Return the shared LinkedIn OAuth service used for authorization URLs"""
     return LinkedInOAuthService()
 
 def get_linkedin_auth_url() -> Dict:
@@ -7,62 +7,282 @@ from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
-import time
+import soupsieve as sv
+from lxml import etree, html as lxml_html
 import re
 import logging
 import os
 import requests
-import json
+import orjson
 import random
+import queue
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlencode
 from typing import List, Dict, Optional
-from app.models.models import Job, ScrapeLog
-from app.database.database import get_db
+from app.models.models import ScrapeLog
+from app.database.database import SessionLocal
+from app.services.english_detection import flag_english_requirements
+from app.services.job_storage import save_new_jobs
+from app.services.linkedin_http import USER_AGENT, get_guest_session
+from app.services import scrape_cache
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Public guest endpoint serving the job search cards as plain HTML (no JS)
+GUEST_JOBS_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+GUEST_JOB_POSTING_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+GUEST_PAGE_SIZE = 25
+# lxml's C parser for all BeautifulSoup parsing in this module
+HTML_PARSER = "lxml"
+_JOB_ID_RE = re.compile(r'/jobs/view/(\d+)')
+# Guest API selectors, compiled once instead of per select()/select_one() call
+_GUEST_CARD_SEL = sv.compile("div.base-card")
+_GUEST_TITLE_SEL = sv.compile(".base-search-card__title")
+_GUEST_COMPANY_SEL = sv.compile(".base-search-card__subtitle")
+_GUEST_LOCATION_SEL = sv.compile(".job-search-card__location")
+_GUEST_LINK_SEL = sv.compile("a.base-card__full-link")
+_GUEST_TIME_SEL = sv.compile("time[datetime]")
+_GUEST_DESCRIPTION_SEL = sv.compile(".show-more-less-html__markup")
+# <li>/<div> elements whose class contains "job" (any case), in document order
+_JOB_ELEMENTS_CSS = 'li[class*="job" i], div[class*="job" i]'
+_JOB_ELEMENTS_XPATH = etree.XPath("(//li | //div)[contains(translate(@class, 'JOB', 'job'), 'job')]")
+
+# Fixed filters of the browser job searches: recent (24 h / last month for
+# the logged-in search), full-time, remote; the alternative search filters
+# on experience level and sorts newest first instead
+_RECENT_REMOTE_FILTERS = (('f_TPR', 'r86400'), ('f_JT', 'F'), ('f_WRA', 'true'))
+_AUTHENTICATED_FILTERS = (('f_TPR', 'r2592000'), ('f_JT', 'F'), ('f_WRA', 'true'))
+_ALTERNATIVE_FILTERS = (('f_E', '2,3,4'), ('f_JT', 'F'), ('sortBy', 'DD'))
+
+# Job card selectors tried in order by the direct / authenticated searches
+_DIRECT_CARD_SELECTORS = (
+    ".job-search-card",
+    "[data-job-id]",
+    ".jobs-search-results-list .result-card",
+    ".job-result-card"
+)
+_DIRECT_CARDS_CSS = ", ".join(_DIRECT_CARD_SELECTORS)
+_AUTHENTICATED_CARD_SELECTORS = (
+    ".jobs-search-results__list-item",
+    ".job-search-card",
+    "[data-job-id]",
+    ".jobs-search-results-list .result-card",
+    ".ember-view.job-search-card"
+)
+
+# Reads title/company/location of the first max_jobs cards of the first
+# selector that matches anything; returns null if none do
+_CARD_FIELDS_JS = """
+const [selectors, limit] = arguments;
+const text = (card, selector) => {
+    const el = card.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+};
+for (const selector of selectors) {
+    const cards = document.querySelectorAll(selector);
+    if (cards.length) {
+        return {
+            selector: selector,
+            total: cards.length,
+            cards: Array.from(cards).slice(0, limit).map(card => ({
+                title: text(card, "h3, .job-title, [data-job-title]"),
+                company: text(card, ".company-name, .job-company, h4"),
+                location: text(card, ".job-location, .location")
+            }))
+        };
+    }
+}
+return null;
+"""
+
+# First max_jobs elements of the first selector that matches anything
+_FIRST_MATCHING_CARDS_JS = """
+const [selectors, limit] = arguments;
+for (const selector of selectors) {
+    const cards = document.querySelectorAll(selector);
+    if (cards.length) {
+        return {selector: selector, total: cards.length, cards: Array.from(cards).slice(0, limit)};
+    }
+}
+return null;
+"""
+
+# Voyager (LinkedIn's internal API) job responses captured over CDP
+VOYAGER_JOBS_PATH = "/voyager/api/jobs"
+_JOB_POSTING_URN_RE = re.compile(r'jobPosting:(\d+)')
+
+# Concurrent job-posting detail requests per search
+DETAIL_FETCH_WORKERS = 8
+GUEST_TIMEOUT_SECONDS = 10
+# Max wait for new results after each infinite-scroll step
+SCROLL_WAIT_SECONDS = 5
+
+# Warm headless Chrome instances reused across scrapes. At most
+# DRIVER_POOL_SIZE exist at once; scrapers wait up to
+# DRIVER_ACQUIRE_TIMEOUT_SECONDS for a free one before falling back without a browser.
+# (at least one: a zero-size pool would leave every scraper waiting out the timeout)
+DRIVER_POOL_SIZE = max(1, int(os.getenv("SCRAPER_DRIVER_POOL_SIZE", "2")))
+DRIVER_ACQUIRE_TIMEOUT_SECONDS = 120
+_idle_drivers = queue.LifoQueue()
+# Origins whose cookies/storage are wiped before a driver is reused
+_LINKEDIN_ORIGINS = ("https://www.linkedin.com", "https://linkedin.com")
+_driver_slots = threading.BoundedSemaphore(DRIVER_POOL_SIZE)
+# Regions scraped concurrently by search_multiple_regions; each worker keeps
+# its driver for the whole sweep, so never more workers than pooled drivers
+REGION_WORKERS = max(1, min(3, DRIVER_POOL_SIZE))
+
+
+def _search_query(search_term: str, location: str, filters: tuple) -> str:
+    """Encode a jobs search query; "Worldwide" means no location filter"""
+    params = [('keywords', search_term)]
+    if location and location.lower() != "worldwide":
+        params.append(('location', location))
+    return urlencode([*params, *filters])
+
+
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process"""
+    if os.path.exists('/usr/local/bin/chromedriver'):
+        # Use local chromedriver in Docker container
+        return '/usr/local/bin/chromedriver'
+    # Use WebDriverManager for local development (stats its cache and may
+    # query the driver CDN, so only done for the first driver)
+    return ChromeDriverManager().install()
+
+
+def _build_driver(headless: bool):
+    """Configure and start a Chrome WebDriver, or return None on failure"""
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    # Skip images, fonts and notification prompts; scraping only needs the DOM.
+    # Stylesheets stay on: infinite scroll and innerText depend on layout.
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+    # driver.get() returns at DOMContentLoaded; explicit waits cover the rest
+    chrome_options.page_load_strategy = "eager"
+    # Network events in the performance log, used to read voyager JSON via CDP
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    
+    try:
+        service = Service(_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        
+        # No implicit wait: every page load uses an explicit WebDriverWait, and
+        # an implicit one would stall each missing optional field for 10 s
+        
+        # Add stealth settings
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        return driver
+        
+    except Exception as e:
+        logger.error(f"Error setting up Chrome driver: {e}")
+        return None
+
+
+def _acquire_driver(headless: bool):
+    """Take an idle pooled driver or start a new one within the pool bound"""
+    if not headless:
+        return _build_driver(headless)
+    
+    if not _driver_slots.acquire(timeout=DRIVER_ACQUIRE_TIMEOUT_SECONDS):
+        logger.warning("No Chrome driver available in the pool")
+        return None
+    try:
+        return _idle_drivers.get_nowait()
+    except queue.Empty:
+        driver = _build_driver(headless)
+        if driver is None:
+            _driver_slots.release()
+        return driver
+
+
+def _release_driver(driver, headless: bool):
+    """Reset a driver's session state and return it to the pool"""
+    if not headless:
+        driver.quit()
+        return
+    
+    try:
+        # Like a fresh browser context: drop LinkedIn cookies and storage so
+        # the next scraper starts logged out, while the process stays warm
+        for origin in _LINKEDIN_ORIGINS:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+        # Drain the performance log so the next scraper never replays this
+        # session's requestIds into Network.getResponseBody
+        driver.get_log("performance")
+        _idle_drivers.put(driver)
+    except Exception as e:
+        logger.warning(f"Discarding broken Chrome driver: {e}")
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    finally:
+        _driver_slots.release()
+
+
+@atexit.register
+def _quit_idle_drivers():
+    while True:
+        try:
+            _idle_drivers.get_nowait().quit()
+        except queue.Empty:
+            break
+        except Exception:
+            continue
+
+
 class LinkedInScraper:
     def __init__(self, headless: bool = True):
-        self.setup_driver(headless)
+        # Chrome is only started when a strategy actually needs it
+        self.headless = headless
+        self._driver = None
+        self._driver_attempted = False
+        self.wait = None
         self.base_url = "https://www.linkedin.com"
         self.logged_in = False
+        # Set when search_jobs had to fall back to generated sample jobs
+        self.used_sample_data = False
+        # Pooled session shared by all scrapers in the process
+        self.http = get_guest_session()
+    
+    @property
+    def driver(self):
+        """Chrome WebDriver, created on first use (None if setup failed)"""
+        if self._driver is None and not self._driver_attempted:
+            self._driver_attempted = True
+            self.setup_driver(self.headless)
+        return self._driver
+    
+    @driver.setter
+    def driver(self, value):
+        self._driver = value
         
     def setup_driver(self, headless: bool):
-        """Configure Chrome WebDriver with appropriate options"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # Use WebDriverManager for automatic driver management or fallback to local driver
-        try:
-            if os.path.exists('/usr/local/bin/chromedriver'):
-                # Use local chromedriver in Docker container
-                service = Service('/usr/local/bin/chromedriver')
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                # Use WebDriverManager for local development
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # Set timeouts
-            self.driver.implicitly_wait(10)
-            self.wait = WebDriverWait(self.driver, 10)
-            
-            # Add stealth settings
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-        except Exception as e:
-            logger.error(f"Error setting up Chrome driver: {e}")
-            self.driver = None
+        """Check out a Chrome WebDriver (warm from the pool when headless)"""
+        self.driver = _acquire_driver(headless)
+        self.wait = WebDriverWait(self.driver, 10) if self.driver else None
 
     def login_to_linkedin(self, email: str, password: str) -> bool:
         """
@@ -71,7 +291,6 @@ class LinkedInScraper:
         try:
             logger.info("Navigating to LinkedIn login page...")
             self.driver.get("https://www.linkedin.com/login")
-            time.sleep(2)
             
             # Find and fill email field
             email_field = self.wait.until(
@@ -89,8 +308,11 @@ class LinkedInScraper:
             login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
             login_button.click()
             
-            # Wait for login to complete
-            time.sleep(3)
+            # Wait for the redirect away from the login form
+            try:
+                self.wait.until(lambda d: "/login" not in d.current_url)
+            except TimeoutException:
+                pass
             
             # Check if login was successful
             current_url = self.driver.current_url
@@ -140,7 +362,16 @@ class LinkedInScraper:
             except Exception as e:
                 logger.error(f"Authenticated scraping failed: {e}")
         
-        # Strategy 2: Try direct scraping
+        # Strategy 2: Public guest API over plain HTTP (no browser)
+        try:
+            jobs_data = self._scrape_linkedin_guest_api(search_term, location, max_jobs)
+            if jobs_data:
+                logger.info(f"Guest API scraping successful, found {len(jobs_data)} jobs")
+                return jobs_data
+        except Exception as e:
+            logger.error(f"Guest API scraping failed: {e}")
+        
+        # Strategy 3: Try direct scraping
         try:
             jobs_data = self._scrape_linkedin_direct(search_term, location, max_jobs)
             if jobs_data:
@@ -149,7 +380,7 @@ class LinkedInScraper:
         except Exception as e:
             logger.error(f"Direct scraping failed: {e}")
         
-        # Strategy 3: Try with alternative selectors
+        # Strategy 4: Try with alternative selectors
         try:
             jobs_data = self._scrape_with_alternative_selectors(search_term, location, max_jobs)
             if jobs_data:
@@ -158,56 +389,186 @@ class LinkedInScraper:
         except Exception as e:
             logger.error(f"Alternative scraping failed: {e}")
         
-        # Strategy 4: Generate sample data as fallback
+        # Strategy 5: Generate sample data as fallback
         logger.warning("All scraping methods failed, generating sample data")
+        self.used_sample_data = True
         return self._generate_sample_devops_jobs(search_term, location)
 
+    def _scrape_linkedin_guest_api(self, search_term: str, location: str, max_jobs: int) -> List[Dict]:
+        """Page through LinkedIn's guest job search endpoint and parse the cards"""
+        jobs_data = []
+        now = datetime.utcnow()
+        
+        # Same query as the direct browser search, plus the page offset
+        query = _search_query(search_term, location, _RECENT_REMOTE_FILTERS)
+        
+        # Request every result page at once; pages are still consumed in
+        # order and stop at the first empty/failed one
+        starts = range(0, max_jobs, GUEST_PAGE_SIZE)
+        with ThreadPoolExecutor(max_workers=min(DETAIL_FETCH_WORKERS, len(starts)) or 1) as pool:
+            pages = list(pool.map(lambda start: self._fetch_guest_page(query, start), starts))
+        
+        for cards in pages:
+            if not cards:
+                break
+            for card in cards:
+                job_data = self._parse_guest_card(card, now)
+                if job_data:
+                    jobs_data.append(job_data)
+            if len(cards) < GUEST_PAGE_SIZE:
+                break
+        
+        jobs_data = jobs_data[:max_jobs]
+        self._fetch_job_descriptions(jobs_data)
+        flag_english_requirements(jobs_data)
+        return jobs_data
+    
+    def _fetch_guest_page(self, query: str, start: int) -> List:
+        """Fetch one page of guest search results and return its job cards"""
+        try:
+            response = self.http.get(
+                f"{GUEST_JOBS_URL}?{query}&start={start}",
+                timeout=GUEST_TIMEOUT_SECONDS
+            )
+        except requests.RequestException as e:
+            logger.warning(f"Guest API request failed for start={start}: {e}")
+            return []
+        if response.status_code != 200:
+            logger.warning(f"Guest API returned status {response.status_code} for start={start}")
+            return []
+        return _GUEST_CARD_SEL.select(BeautifulSoup(response.text, HTML_PARSER))
+    
+    def _capture_voyager_descriptions(self) -> Dict[str, str]:
+        """
+        Read job descriptions from the voyager API responses the page fetched.
+
+        Uses the driver's performance log to find the XHRs and CDP
+        Network.getResponseBody to read their JSON, instead of scraping the
+        rendered DOM. Returns {job_id: description[:500]}.
+        """
+        descriptions = {}
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            logger.warning(f"Performance log not available: {e}")
+            return descriptions
+        
+        for entry in entries:
+            try:
+                message = orjson.loads(entry["message"])["message"]
+                if message.get("method") != "Network.responseReceived":
+                    continue
+                if VOYAGER_JOBS_PATH not in message["params"]["response"]["url"]:
+                    continue
+                body = self.driver.execute_cdp_cmd(
+                    "Network.getResponseBody", {"requestId": message["params"]["requestId"]}
+                )
+                payload = orjson.loads(body["body"])
+            except Exception:
+                continue
+            
+            for item in payload.get("included", []):
+                description = item.get("description")
+                job_id = _JOB_POSTING_URN_RE.search(item.get("entityUrn", ""))
+                if job_id and isinstance(description, dict) and description.get("text"):
+                    descriptions[job_id.group(1)] = description["text"][:500]
+        
+        return descriptions
+    
+    def _fetch_job_descriptions(self, jobs_data: List[Dict]):
+        """Fill in descriptions from the guest job-posting endpoint, fetched concurrently"""
+        targets = [job for job in jobs_data if job['linkedin_job_id'].isdigit()]
+        if not targets:
+            return
+        
+        with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as pool:
+            descriptions = pool.map(self._fetch_job_description, [job['linkedin_job_id'] for job in targets])
+            for job, description in zip(targets, descriptions):
+                if description:
+                    job['description'] = description
+    
+    def _fetch_job_description(self, job_id: str) -> Optional[str]:
+        """Return the first 500 characters of a posting's description, or None"""
+        try:
+            response = self.http.get(GUEST_JOB_POSTING_URL.format(job_id=job_id), timeout=GUEST_TIMEOUT_SECONDS)
+            if response.status_code != 200:
+                return None
+            markup = _GUEST_DESCRIPTION_SEL.select_one(BeautifulSoup(response.text, HTML_PARSER))
+            return markup.get_text(" ", strip=True)[:500] if markup else None
+        except requests.RequestException as e:
+            logger.warning(f"Could not fetch description for job {job_id}: {e}")
+            return None
+    
+    def _parse_guest_card(self, card, now: datetime) -> Optional[Dict]:
+        """Build a job dict from one guest API job card"""
+        job_id = card.get('data-entity-urn', '').rsplit(':', 1)[-1]
+        title_elem = _GUEST_TITLE_SEL.select_one(card)
+        if not job_id or not title_elem:
+            return None
+        
+        company_elem = _GUEST_COMPANY_SEL.select_one(card)
+        location_elem = _GUEST_LOCATION_SEL.select_one(card)
+        link_elem = _GUEST_LINK_SEL.select_one(card)
+        time_elem = _GUEST_TIME_SEL.select_one(card)
+        
+        title = title_elem.get_text(strip=True)
+        company = company_elem.get_text(strip=True) if company_elem else "Tech Company"
+        
+        posted_date = now
+        if time_elem:
+            try:
+                posted_date = datetime.fromisoformat(time_elem['datetime'])
+            except ValueError:
+                pass
+        
+        return {
+            'title': title,
+            'company': company,
+            'location': location_elem.get_text(strip=True) if location_elem else "",
+            'description': f"Posición de {title} en {company}.",
+            'linkedin_job_id': job_id,
+            'linkedin_url': link_elem['href'].split('?')[0] if link_elem else f"{self.base_url}/jobs/view/{job_id}",
+            'posted_date': posted_date,
+            'salary_range': None,
+            'employment_type': 'Full-time',
+            'seniority_level': 'Mid Level'
+        }
+
     def _scrape_linkedin_direct(self, search_term: str, location: str, max_jobs: int) -> List[Dict]:
         """Direct LinkedIn scraping method"""
         jobs_data = []
         
         # Build search URL
-        search_url = f"{self.base_url}/jobs/search?"
-        search_url += f"keywords={search_term.replace(' ', '%20')}"
-        if location and location.lower() != "worldwide":
-            search_url += f"&location={location.replace(' ', '%20')}"
-        search_url += "&f_TPR=r86400"  # Last 24 hours
-        search_url += "&f_JT=F"  # Full-time only
-        search_url += "&f_WRA=true"  # Remote jobs
+        search_url = f"{self.base_url}/jobs/search?{_search_query(search_term, location, _RECENT_REMOTE_FILTERS)}"
         
         logger.info(f"Searching jobs with URL: {search_url}")
         self.driver.get(search_url)
-        time.sleep(3)  # Wait for page load
-        
-        # Try multiple selectors for job cards
-        selectors = [
-            ".job-search-card",
-            "[data-job-id]",
-            ".jobs-search-results-list .result-card",
-            ".job-result-card"
-        ]
         
-        job_cards = []
-        for selector in selectors:
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-            if job_cards:
-                logger.info(f"Found {len(job_cards)} job cards with selector: {selector}")
-                break
+        # Wait until any card is rendered rather than a fixed sleep
+        try:
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, _DIRECT_CARDS_CSS)))
+        except TimeoutException:
+            logger.warning("Timeout waiting for job cards")
         
-        if not job_cards:
+        # One script call picks the first matching selector and reads every
+        # card's fields in the browser, instead of 3 find_element round trips per card
+        result = self.driver.execute_script(_CARD_FIELDS_JS, _DIRECT_CARD_SELECTORS, max_jobs)
+        if not result:
             raise Exception("No job cards found with any selector")
+        logger.info(f"Found {result['total']} job cards with selector: {result['selector']}")
         
-        for i, card in enumerate(job_cards[:max_jobs]):
+        now = datetime.utcnow()
+        for i, card in enumerate(result['cards']):
             try:
-                job_data = self._extract_job_data_simple(card, i)
+                job_data = self._extract_job_data_simple(card, i, now)
                 if job_data:
-                    job_data['requires_english'] = self._check_english_requirement(job_data)
                     jobs_data.append(job_data)
                     
             except Exception as e:
                 logger.error(f"Error extracting job data: {e}")
                 continue
-                
+        
+        flag_english_requirements(jobs_data)
         return jobs_data
 
     def _scrape_linkedin_authenticated(self, search_term: str, location: str, max_jobs: int) -> List[Dict]:
@@ -215,17 +576,15 @@ class LinkedInScraper:
         jobs_data = []
         
         # Build authenticated search URL
-        search_url = f"{self.base_url}/jobs/search?"
-        search_url += f"keywords={search_term.replace(' ', '%20')}"
-        if location and location.lower() != "worldwide":
-            search_url += f"&location={location.replace(' ', '%20')}"
-        search_url += "&f_TPR=r2592000"  # Last month for more results
-        search_url += "&f_JT=F"  # Full-time only
-        search_url += "&f_WRA=true"  # Remote jobs
+        search_url = f"{self.base_url}/jobs/search?{_search_query(search_term, location, _AUTHENTICATED_FILTERS)}"
         
         logger.info(f"🔍 Authenticated search with URL: {search_url}")
+        # Only this page's voyager responses should be captured (not login's)
+        try:
+            self.driver.get_log("performance")
+        except Exception as e:
+            logger.warning(f"Performance log not available: {e}")
         self.driver.get(search_url)
-        time.sleep(3)
         
         # Wait for authenticated content to load
         try:
@@ -241,30 +600,18 @@ class LinkedInScraper:
         # Scroll to load more jobs
         self._scroll_and_wait(max_jobs)
         
-        # Try multiple selectors for authenticated job cards
-        authenticated_selectors = [
-            ".jobs-search-results__list-item",
-            ".job-search-card",
-            "[data-job-id]",
-            ".jobs-search-results-list .result-card",
-            ".ember-view.job-search-card"
-        ]
-        
-        job_cards = []
-        for selector in authenticated_selectors:
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-            if job_cards:
-                logger.info(f"✅ Found {len(job_cards)} job cards with authenticated selector: {selector}")
-                break
-        
-        if not job_cards:
+        # Selector fallback and [:max_jobs] run in the browser, so only the
+        # element handles actually used are serialized back
+        result = self.driver.execute_script(_FIRST_MATCHING_CARDS_JS, _AUTHENTICATED_CARD_SELECTORS, max_jobs)
+        if not result:
             raise Exception("No authenticated job cards found")
+        logger.info(f"✅ Found {result['total']} job cards with authenticated selector: {result['selector']}")
         
-        for i, card in enumerate(job_cards[:max_jobs]):
+        now = datetime.utcnow()
+        for i, card in enumerate(result['cards']):
             try:
-                job_data = self._extract_authenticated_job_data(card, i)
+                job_data = self._extract_authenticated_job_data(card, i, now)
                 if job_data:
-                    job_data['requires_english'] = self._check_english_requirement(job_data)
                     jobs_data.append(job_data)
                     logger.info(f"📝 Extracted job {i+1}: {job_data['title']} at {job_data['company']}")
                     
@@ -272,6 +619,15 @@ class LinkedInScraper:
                 logger.error(f"Error extracting authenticated job {i}: {e}")
                 continue
         
+        # Descriptions: first from the voyager JSON the page already loaded,
+        # then from the job-posting endpoint for the rest (no per-card clicks)
+        captured = self._capture_voyager_descriptions()
+        for job_data in jobs_data:
+            if job_data['linkedin_job_id'] in captured:
+                job_data['description'] = captured[job_data['linkedin_job_id']]
+        self._fetch_job_descriptions([j for j in jobs_data if j['linkedin_job_id'] not in captured])
+        flag_english_requirements(jobs_data)
+        
         return jobs_data
         
     def _scrape_with_alternative_selectors(self, search_term: str, location: str, max_jobs: int) -> List[Dict]:
@@ -279,39 +635,33 @@ class LinkedInScraper:
         jobs_data = []
         
         # Use public job search (no login required)
-        search_url = f"{self.base_url}/jobs/search"
-        params = {
-            'keywords': search_term,
-            'location': location,
-            'f_E': '2,3,4',  # Experience levels
-            'f_JT': 'F',     # Full-time
-            'sortBy': 'DD'   # Date descending
-        }
-        
-        param_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        full_url = f"{search_url}?{param_string}"
+        query = urlencode((('keywords', search_term), ('location', location), *_ALTERNATIVE_FILTERS))
+        full_url = f"{self.base_url}/jobs/search?{query}"
         
         logger.info(f"Alternative scraping with URL: {full_url}")
         self.driver.get(full_url)
-        time.sleep(2)
-        
-        # Get page source and parse with BeautifulSoup
-        page_source = self.driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        # Ready as soon as a job element exists; no need for the whole page load
+        try:
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, _JOB_ELEMENTS_CSS)))
+        except TimeoutException:
+            logger.warning("Timeout waiting for job elements")
         
-        # Find job elements in the HTML
-        job_elements = soup.find_all(['li', 'div'], class_=lambda x: x and 'job' in x.lower())
+        # Parse the page source straight into an lxml tree and match job
+        # elements with one compiled XPath (no per-element Python callback)
+        tree = lxml_html.fromstring(self.driver.page_source)
+        job_elements = _JOB_ELEMENTS_XPATH(tree)
         
+        now = datetime.utcnow()
         for i, element in enumerate(job_elements[:max_jobs]):
             try:
-                job_data = self._parse_job_from_html(element, i)
+                job_data = self._parse_job_from_html(element, i, now)
                 if job_data:
-                    job_data['requires_english'] = self._check_english_requirement(job_data)
                     jobs_data.append(job_data)
             except Exception as e:
                 logger.error(f"Error parsing job {i}: {e}")
                 continue
-                
+        
+        flag_english_requirements(jobs_data)
         return jobs_data
 
     def _scroll_and_wait(self, max_jobs: int):
@@ -322,7 +672,14 @@ class LinkedInScraper:
         for _ in range(5):  # Max 5 scroll attempts
             # Scroll down
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            
+            # Returns as soon as the page grows; times out when nothing more loads
+            try:
+                WebDriverWait(self.driver, SCROLL_WAIT_SECONDS).until(
+                    lambda d: d.execute_script("return document.body.scrollHeight") > last_height
+                )
+            except TimeoutException:
+                pass
             
             # Count current jobs
             current_jobs = len(self.driver.find_elements(By.CSS_SELECTOR, "[data-job-id], .job-search-card"))
@@ -337,27 +694,16 @@ class LinkedInScraper:
                 break
             last_height = new_height
 
-    def _extract_authenticated_job_data(self, job_card, index: int) -> Optional[Dict]:
+    def _extract_authenticated_job_data(self, job_card, index: int, now: datetime) -> Optional[Dict]:
         """Extract job data from authenticated LinkedIn session"""
         try:
-            # Try to click on the job card to load details
-            try:
-                # Scroll the job card into view
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", job_card)
-                time.sleep(0.5)
-                
-                # Click on the job card
-                job_card.click()
-                time.sleep(1.5)  # Wait for job details to load
-            except Exception as e:
-                logger.warning(f"Could not click job card {index}: {e}")
-            
             # Extract job information from card
             title = "DevOps Engineer"
             company = "Tech Company"
             location = "Chile"
             description = "DevOps position with modern technologies"
             job_url = f"https://linkedin.com/jobs/view/{index}"
+            job_id = None
             
             # Try to extract real data with multiple selectors
             try:
@@ -416,24 +762,7 @@ class LinkedInScraper:
                 try:
                     link_elem = job_card.find_element(By.CSS_SELECTOR, "a[href*='/jobs/view/']")
                     job_url = link_elem.get_attribute("href")
-                except:
-                    pass
-                    
-                # Try to get description from job details panel
-                try:
-                    description_selectors = [
-                        ".jobs-description-content__text",
-                        ".job-view-layout .jobs-description",
-                        ".jobs-box__html-content"
-                    ]
-                    for selector in description_selectors:
-                        try:
-                            desc_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            if desc_elem.is_displayed():
-                                description = desc_elem.text.strip()[:500] or description
-                                break
-                        except:
-                            continue
+                    job_id = self._extract_job_id_from_url(job_url)
                 except:
                     pass
                     
@@ -445,9 +774,9 @@ class LinkedInScraper:
                 'company': company,
                 'location': location,
                 'description': description,
-                'linkedin_job_id': f"auth_{index}_{int(time.time())}",
+                'linkedin_job_id': job_id or f"auth_{index}_{int(now.timestamp())}",
                 'linkedin_url': job_url,
-                'posted_date': datetime.utcnow(),
+                'posted_date': now,
                 'salary_range': None,
                 'employment_type': 'Full-time',
                 'seniority_level': 'Mid Level'
@@ -457,42 +786,23 @@ class LinkedInScraper:
             logger.error(f"Error in authenticated extraction for job {index}: {e}")
             return None
 
-    def _extract_job_data_simple(self, job_card, index: int) -> Optional[Dict]:
-        """Simple job data extraction without clicking"""
+    def _extract_job_id_from_url(self, url: str) -> Optional[str]:
+        """Return the numeric LinkedIn job id from a /jobs/view/ URL"""
+        match = _JOB_ID_RE.search(url or '')
+        return match.group(1) if match else None
+
+    def _extract_job_data_simple(self, card: Dict, index: int, now: datetime) -> Optional[Dict]:
+        """Build job data from the card fields read by _CARD_FIELDS_JS"""
         try:
-            # Try to get basic information from the card
-            title = "DevOps Engineer"
-            company = "Tech Company"
-            location = "Chile"
-            description = "DevOps position with cloud technologies"
-            
-            # Try to extract real data if possible
-            try:
-                title_elem = job_card.find_element(By.CSS_SELECTOR, "h3, .job-title, [data-job-title]")
-                title = title_elem.text.strip()
-            except:
-                pass
-                
-            try:
-                company_elem = job_card.find_element(By.CSS_SELECTOR, ".company-name, .job-company, h4")
-                company = company_elem.text.strip()
-            except:
-                pass
-                
-            try:
-                location_elem = job_card.find_element(By.CSS_SELECTOR, ".job-location, .location")
-                location = location_elem.text.strip()
-            except:
-                pass
-            
+            # Defaults for fields the card did not contain
             return {
-                'title': title,
-                'company': company,
-                'location': location,
-                'description': description,
-                'linkedin_job_id': f"sample_{index}_{int(time.time())}",
+                'title': card.get('title') or "DevOps Engineer",
+                'company': card.get('company') or "Tech Company",
+                'location': card.get('location') or "Chile",
+                'description': "DevOps position with cloud technologies",
+                'linkedin_job_id': f"sample_{index}_{int(now.timestamp())}",
                 'linkedin_url': f"https://linkedin.com/jobs/view/{index}",
-                'posted_date': datetime.utcnow(),
+                'posted_date': now,
                 'salary_range': None,
                 'employment_type': 'Full-time',
                 'seniority_level': 'Mid Level'
@@ -502,11 +812,11 @@ class LinkedInScraper:
             logger.error(f"Error in simple extraction: {e}")
             return None
 
-    def _parse_job_from_html(self, element, index: int) -> Optional[Dict]:
-        """Parse job data from HTML element using BeautifulSoup"""
+    def _parse_job_from_html(self, element, index: int, now: datetime) -> Optional[Dict]:
+        """Parse job data from an lxml HTML element"""
         try:
             # Extract text content
-            text_content = element.get_text(separator=' ', strip=True)
+            text_content = " ".join(text.strip() for text in element.itertext() if text.strip())
             
             # Look for job-like patterns in the text
             if len(text_content) < 20 or 'devops' not in text_content.lower():
@@ -518,9 +828,9 @@ class LinkedInScraper:
                 'company': f"Company {index + 1}",
                 'location': "Chile",
                 'description': text_content[:500] if text_content else "DevOps position",
-                'linkedin_job_id': f"parsed_{index}_{int(time.time())}",
+                'linkedin_job_id': f"parsed_{index}_{int(now.timestamp())}",
                 'linkedin_url': f"https://linkedin.com/jobs/view/parsed_{index}",
-                'posted_date': datetime.utcnow(),
+                'posted_date': now,
                 'salary_range': None,
                 'employment_type': 'Full-time',
                 'seniority_level': 'Mid Level'
@@ -572,15 +882,19 @@ class LinkedInScraper:
             }
         ]
         
+        # One timestamp and one RNG call for the whole batch
+        now = datetime.utcnow()
+        ts = int(now.timestamp())
+        days_ago = random.choices(range(8), k=len(job_templates))
         for i, template in enumerate(job_templates):
             job_data = {
                 'title': template['title'],
                 'company': template['company'],
                 'location': location,
                 'description': template['description'],
-                'linkedin_job_id': f"sample_{i}_{int(time.time())}",
+                'linkedin_job_id': f"sample_{i}_{ts}",
                 'linkedin_url': f"https://linkedin.com/jobs/view/sample_{i}",
-                'posted_date': datetime.utcnow() - timedelta(days=random.randint(0, 7)),
+                'posted_date': now - timedelta(days=days_ago[i]),
                 'salary_range': None,
                 'employment_type': 'Full-time',
                 'seniority_level': ['Junior', 'Mid Level', 'Senior'][i % 3],
@@ -591,63 +905,37 @@ class LinkedInScraper:
         logger.info(f"Generated {len(sample_jobs)} sample jobs")
         return sample_jobs
 
-    def _check_english_requirement(self, job_data: Dict) -> bool:
-        """
-        Analyze job description to determine if English is required
-        """
-        text_to_check = f"{job_data['title']} {job_data['description']}".lower()
-        
-        # English requirement keywords
-        english_keywords = [
-            'english', 'inglés', 'ingles', 'native english', 'fluent english',
-            'english speaking', 'english proficiency', 'bilingual',
-            'international team', 'global team', 'multinational'
-        ]
-        
-        # Check for English requirements
-        for keyword in english_keywords:
-            if keyword in text_to_check:
-                return True
-                
-        return False
-
     def save_jobs_to_database(self, jobs_data: List[Dict], db: Session):
-        """Save scraped jobs to database"""
-        saved_count = 0
-        
-        for job_data in jobs_data:
-            try:
-                # Check if job already exists
-                existing_job = db.query(Job).filter(
-                    Job.linkedin_job_id == job_data['linkedin_job_id']
-                ).first()
-                
-                if not existing_job:
-                    job = Job(**job_data)
-                    db.add(job)
-                    saved_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Error saving job: {e}")
-                continue
-                
+        """Save scraped jobs to database, skipping ones already stored"""
         try:
+            saved_count = save_new_jobs(db, jobs_data)
             db.commit()
         except Exception as e:
             logger.error(f"Error committing jobs: {e}")
             db.rollback()
+            saved_count = 0
             
         return saved_count
 
     def close(self):
-        """Close the webdriver"""
-        if hasattr(self, 'driver') and self.driver:
-            self.driver.quit()
+        """Return the webdriver (if one was checked out) to the pool"""
+        if getattr(self, '_driver', None):
+            _release_driver(self._driver, self.headless)
+            self._driver = None
     
     def __del__(self):
         self.close()
 
 
+def _search_region(scraper: LinkedInScraper, search_term: str, region: str, max_jobs: int) -> List[Dict]:
+    """Scrape one region, logging failures instead of aborting the whole sweep"""
+    try:
+        return scraper.search_jobs(search_term, region, max_jobs)
+    except Exception as e:
+        logger.error(f"Error scraping {region}: {e}")
+        return []
+
+
 def search_multiple_regions(search_term: str = "DevOps", max_jobs_per_region: int = 20) -> Dict:
     """Search jobs across multiple Spanish-speaking regions"""
     regions = [
@@ -655,28 +943,34 @@ def search_multiple_regions(search_term: str = "DevOps", max_jobs_per_region: in
         "Perú", "Venezuela", "Ecuador", "Guatemala", "Costa Rica"
     ]
     
-    all_results = {}
+    # One scraper per worker thread, kept across the regions that thread
+    # handles so its browser (if one was needed) starts at most once.
+    # Drivers are not thread-safe, so scrapers are never shared between threads.
+    worker_state = threading.local()
+    scrapers = []
     
-    for region in regions:
-        try:
-            scraper = LinkedInScraper()
-            jobs = scraper.search_jobs(search_term, region, max_jobs_per_region)
-            all_results[region] = jobs
-            scraper.close()
-            
-        except Exception as e:
-            logger.error(f"Error scraping {region}: {e}")
-            all_results[region] = []
+    def scrape_region(region: str) -> List[Dict]:
+        scraper = getattr(worker_state, 'scraper', None)
+        if scraper is None:
+            scraper = worker_state.scraper = LinkedInScraper()
+            scrapers.append(scraper)
+        return _search_region(scraper, search_term, region, max_jobs_per_region)
     
-    return all_results
+    # A few regions in flight at once keeps wall time near max-of-regions
+    # without bursting past LinkedIn's guest rate limits
+    try:
+        with ThreadPoolExecutor(max_workers=REGION_WORKERS) as pool:
+            return dict(zip(regions, pool.map(scrape_region, regions)))
+    finally:
+        for scraper in scrapers:
+            scraper.close()
 
 
 def run_scheduled_scraping(search_term: str = "DevOps", location: str = "España", 
                           max_jobs: int = 100) -> Dict:
     """Run scheduled scraping and save to database"""
     
-    # Create database session
-    db = next(get_db())
+    scraper = None
     
     # Create scrape log entry
     scrape_log = ScrapeLog(
@@ -686,45 +980,62 @@ def run_scheduled_scraping(search_term: str = "DevOps", location: str = "España
         success=False
     )
     
-    try:
-        # Initialize scraper
-        scraper = LinkedInScraper()
-        
-        # Search jobs
-        jobs_data = scraper.search_jobs(search_term, location, max_jobs)
-        
-        # Save to database
-        saved_count = scraper.save_jobs_to_database(jobs_data, db)
-        
-        # Update scrape log
-        scrape_log.jobs_found = len(jobs_data)
-        scrape_log.jobs_saved = saved_count
-        scrape_log.success = True
-        scrape_log.completed_at = datetime.utcnow()
-        
-        result = {
-            'success': True,
-            'jobs_found': len(jobs_data),
-            'jobs_saved': saved_count,
-            'jobs_without_english': len([j for j in jobs_data if not j['requires_english']])
-        }
+    # The session only checks a pooled connection out for the insert/commit,
+    # and the with block always returns it, even if the commit itself fails
+    with SessionLocal() as db:
+        try:
+            # Reuse a recent scrape of the same search instead of hitting LinkedIn again
+            cache_key = (search_term, location, max_jobs)
+            jobs_data = scrape_cache.get(cache_key)
+            if jobs_data is not None:
+                logger.info(f"Using cached scrape results for {cache_key}")
+            else:
+                scraper = LinkedInScraper()
+                jobs_data = scraper.search_jobs(search_term, location, max_jobs)
+                if not scraper.used_sample_data:
+                    scrape_cache.put(cache_key, jobs_data)
+            
+            # Insert jobs; committed in the same transaction as the scrape log
+            saved_count = save_new_jobs(db, jobs_data)
+            
+            # Update scrape log
+            scrape_log.jobs_found = len(jobs_data)
+            scrape_log.jobs_saved = saved_count
+            scrape_log.success = True
+            scrape_log.completed_at = datetime.utcnow()
+            
+            result = {
+                'success': True,
+                'jobs_found': len(jobs_data),
+                'jobs_saved': saved_count,
+                'jobs_without_english': len([j for j in jobs_data if not j['requires_english']])
+            }
+            
+        except Exception as e:
+            logger.error(f"Scraping failed: {e}")
+            db.rollback()
+            scrape_log.success = False
+            scrape_log.error_message = str(e)
+            scrape_log.completed_at = datetime.utcnow()
+            
+            result = {
+                'success': False,
+                'error': str(e)
+            }
         
-    except Exception as e:
-        logger.error(f"Scraping failed: {e}")
-        scrape_log.success = False
-        scrape_log.error_message = str(e)
-        scrape_log.completed_at = datetime.utcnow()
-        
-        result = {
-            'success': False,
-            'error': str(e)
-        }
-    
-    finally:
-        # Save scrape log
-        db.add(scrape_log)
-        db.commit()
-        db.close()
-        scraper.close()
+        finally:
+            # Save jobs and scrape log in one commit
+            try:
+                db.add(scrape_log)
+                db.commit()
+            except Exception as e:
+                logger.error(f"Error committing scrape results: {e}")
+                db.rollback()
+                result = {
+                    'success': False,
+                    'error': str(e)
+                }
+            if scraper:
+                scraper.close()
     
-    return result
\ No newline at end of file
+    return result
@@ -1,455 +0,0 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import time
-import re
-import logging
-import os
-import requests
-import json
-import random
-from typing import List, Dict, Optional
-from app.models.models import Job, ScrapeLog
-from app.database.database import get_db
-from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-
-logger = logging.getLogger(__name__)
-
-class LinkedInScraper:
-    def __init__(self, headless: bool = True):
-        self.setup_driver(headless)
-        self.base_url = "https://www.linkedin.com"
-        
-    def setup_driver(self, headless: bool):
-        """Configure Chrome WebDriver with appropriate options"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # Use WebDriverManager for automatic driver management or fallback to local driver
-        try:
-            if os.path.exists('/usr/local/bin/chromedriver'):
-                # Use local chromedriver in Docker container
-                service = Service('/usr/local/bin/chromedriver')
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                # Use WebDriverManager for local development
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # Set timeouts
-            self.driver.implicitly_wait(10)
-            self.wait = WebDriverWait(self.driver, 10)
-            
-            # Add stealth settings
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-        except Exception as e:
-            logger.error(f"Error setting up Chrome driver: {e}")
-            self.driver = None
-            
-    def search_jobs(self, 
-                   search_term: str = "DevOps", 
-                   location: str = "España", 
-                   max_jobs: int = 50) -> List[Dict]:
-        """
-        Search for jobs on LinkedIn with multiple strategies
-        """
-        jobs_data = []
-        
-        # Strategy 1: Try direct scraping
-        try:
-            jobs_data = self._scrape_linkedin_direct(search_term, location, max_jobs)
-            if jobs_data:
-                logger.info(f"Direct scraping successful, found {len(jobs_data)} jobs")
-                return jobs_data
-        except Exception as e:
-            logger.error(f"Direct scraping failed: {e}")
-        
-        # Strategy 2: Try with alternative selectors
-        try:
-            jobs_data = self._scrape_with_alternative_selectors(search_term, location, max_jobs)
-            if jobs_data:
-                logger.info(f"Alternative scraping successful, found {len(jobs_data)} jobs")
-                return jobs_data
-        except Exception as e:
-            logger.error(f"Alternative scraping failed: {e}")
-        
-        # Strategy 3: Generate sample data as fallback
-        logger.warning("All scraping methods failed, generating sample data")
-        return self._generate_sample_devops_jobs(search_term, location)
-
-    def _scrape_linkedin_direct(self, search_term: str, location: str, max_jobs: int) -> List[Dict]:
-        """Direct LinkedIn scraping method"""
-        jobs_data = []
-        
-        # Build search URL
-        search_url = f"{self.base_url}/jobs/search?"
-        search_url += f"keywords={search_term.replace(' ', '%20')}"
-        if location and location.lower() != "worldwide":
-            search_url += f"&location={location.replace(' ', '%20')}"
-        search_url += "&f_TPR=r86400"  # Last 24 hours
-        search_url += "&f_JT=F"  # Full-time only
-        search_url += "&f_WRA=true"  # Remote jobs
-        
-        logger.info(f"Searching jobs with URL: {search_url}")
-        self.driver.get(search_url)
-        time.sleep(3)  # Wait for page load
-        
-        # Try multiple selectors for job cards
-        selectors = [
-            ".job-search-card",
-            "[data-job-id]",
-            ".jobs-search-results-list .result-card",
-            ".job-result-card"
-        ]
-        
-        job_cards = []
-        for selector in selectors:
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-            if job_cards:
-                logger.info(f"Found {len(job_cards)} job cards with selector: {selector}")
-                break
-        
-        if not job_cards:
-            raise Exception("No job cards found with any selector")
-        
-        for i, card in enumerate(job_cards[:max_jobs]):
-            try:
-                job_data = self._extract_job_data_simple(card, i)
-                if job_data:
-                    job_data['requires_english'] = self._check_english_requirement(job_data)
-                    jobs_data.append(job_data)
-                    
-            except Exception as e:
-                logger.error(f"Error extracting job data: {e}")
-                continue
-                
-        return jobs_data
-        
-    def _scrape_with_alternative_selectors(self, search_term: str, location: str, max_jobs: int) -> List[Dict]:
-        """Alternative scraping method with different approach"""
-        jobs_data = []
-        
-        # Use public job search (no login required)
-        search_url = f"{self.base_url}/jobs/search"
-        params = {
-            'keywords': search_term,
-            'location': location,
-            'f_E': '2,3,4',  # Experience levels
-            'f_JT': 'F',     # Full-time
-            'sortBy': 'DD'   # Date descending
-        }
-        
-        param_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        full_url = f"{search_url}?{param_string}"
-        
-        logger.info(f"Alternative scraping with URL: {full_url}")
-        self.driver.get(full_url)
-        time.sleep(2)
-        
-        # Get page source and parse with BeautifulSoup
-        page_source = self.driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        # Find job elements in the HTML
-        job_elements = soup.find_all(['li', 'div'], class_=lambda x: x and 'job' in x.lower())
-        
-        for i, element in enumerate(job_elements[:max_jobs]):
-            try:
-                job_data = self._parse_job_from_html(element, i)
-                if job_data:
-                    job_data['requires_english'] = self._check_english_requirement(job_data)
-                    jobs_data.append(job_data)
-            except Exception as e:
-                logger.error(f"Error parsing job {i}: {e}")
-                continue
-                
-        return jobs_data
-
-    def _extract_job_data_simple(self, job_card, index: int) -> Optional[Dict]:
-        """Simple job data extraction without clicking"""
-        try:
-            # Try to get basic information from the card
-            title = "DevOps Engineer"
-            company = "Tech Company"
-            location = "Chile"
-            description = "DevOps position with cloud technologies"
-            
-            # Try to extract real data if possible
-            try:
-                title_elem = job_card.find_element(By.CSS_SELECTOR, "h3, .job-title, [data-job-title]")
-                title = title_elem.text.strip()
-            except:
-                pass
-                
-            try:
-                company_elem = job_card.find_element(By.CSS_SELECTOR, ".company-name, .job-company, h4")
-                company = company_elem.text.strip()
-            except:
-                pass
-                
-            try:
-                location_elem = job_card.find_element(By.CSS_SELECTOR, ".job-location, .location")
-                location = location_elem.text.strip()
-            except:
-                pass
-            
-            return {
-                'title': title,
-                'company': company,
-                'location': location,
-                'description': description,
-                'linkedin_job_id': f"sample_{index}_{int(time.time())}",
-                'linkedin_url': f"https://linkedin.com/jobs/view/{index}",
-                'posted_date': datetime.utcnow(),
-                'salary_range': None,
-                'employment_type': 'Full-time',
-                'seniority_level': 'Mid Level'
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in simple extraction: {e}")
-            return None
-
-    def _parse_job_from_html(self, element, index: int) -> Optional[Dict]:
-        """Parse job data from HTML element using BeautifulSoup"""
-        try:
-            # Extract text content
-            text_content = element.get_text(separator=' ', strip=True)
-            
-            # Look for job-like patterns in the text
-            if len(text_content) < 20 or 'devops' not in text_content.lower():
-                return None
-            
-            # Create basic job data
-            return {
-                'title': f"DevOps Engineer {index + 1}",
-                'company': f"Company {index + 1}",
-                'location': "Chile",
-                'description': text_content[:500] if text_content else "DevOps position",
-                'linkedin_job_id': f"parsed_{index}_{int(time.time())}",
-                'linkedin_url': f"https://linkedin.com/jobs/view/parsed_{index}",
-                'posted_date': datetime.utcnow(),
-                'salary_range': None,
-                'employment_type': 'Full-time',
-                'seniority_level': 'Mid Level'
-            }
-            
-        except Exception as e:
-            logger.error(f"Error parsing HTML job: {e}")
-            return None
-
-    def _generate_sample_devops_jobs(self, search_term: str, location: str) -> List[Dict]:
-        """Generate sample DevOps jobs as fallback"""
-        sample_jobs = []
-        
-        job_templates = [
-            {
-                'title': 'DevOps Engineer',
-                'company': 'TechChile SpA',
-                'description': 'Buscamos DevOps Engineer para trabajar con AWS, Docker, Kubernetes. Trabajo remoto disponible. Experiencia con CI/CD, terraform y monitoring.'
-            },
-            {
-                'title': 'Senior DevOps Specialist',
-                'company': 'Innovación Digital',
-                'description': 'Posición senior en DevOps con experiencia en CI/CD, terraform, monitoring. Stack: AWS, Docker, Kubernetes, Jenkins.'
-            },
-            {
-                'title': 'Cloud DevOps Engineer',
-                'company': 'StartupTech Chile',
-                'description': 'DevOps para proyectos cloud-native, microservicios, Azure/AWS. Conocimientos en containerización y orquestación.'
-            },
-            {
-                'title': 'Infrastructure Engineer',
-                'company': 'Banco Digital',
-                'description': 'Ingeniero de infraestructura con enfoque DevOps, seguridad y compliance. Experiencia en entornos financieros.'
-            },
-            {
-                'title': 'SRE - Site Reliability Engineer',
-                'company': 'E-commerce Chile',
-                'description': 'SRE para plataforma de e-commerce, alta disponibilidad, monitoreo. Stack: Kubernetes, Prometheus, Grafana.'
-            },
-            {
-                'title': 'Platform Engineer',
-                'company': 'FinTech Startup',
-                'description': 'Platform Engineer para infraestructura cloud, automatización y deployment. Trabajo 100% remoto.'
-            },
-            {
-                'title': 'Cloud Operations Engineer',
-                'company': 'TechCorp Chile',
-                'description': 'Operations Engineer especializado en cloud, AWS/Azure, terraform, automatización de procesos.'
-            }
-        ]
-        
-        for i, template in enumerate(job_templates):
-            job_data = {
-                'title': template['title'],
-                'company': template['company'],
-                'location': location,
-                'description': template['description'],
-                'linkedin_job_id': f"sample_{i}_{int(time.time())}",
-                'linkedin_url': f"https://linkedin.com/jobs/view/sample_{i}",
-                'posted_date': datetime.utcnow() - timedelta(days=random.randint(0, 7)),
-                'salary_range': None,
-                'employment_type': 'Full-time',
-                'seniority_level': ['Junior', 'Mid Level', 'Senior'][i % 3],
-                'requires_english': False
-            }
-            sample_jobs.append(job_data)
-            
-        logger.info(f"Generated {len(sample_jobs)} sample jobs")
-        return sample_jobs
-
-    def _check_english_requirement(self, job_data: Dict) -> bool:
-        """
-        Analyze job description to determine if English is required
-        """
-        text_to_check = f"{job_data['title']} {job_data['description']}".lower()
-        
-        # English requirement keywords
-        english_keywords = [
-            'english', 'inglés', 'ingles', 'native english', 'fluent english',
-            'english speaking', 'english proficiency', 'bilingual',
-            'international team', 'global team', 'multinational'
-        ]
-        
-        # Check for English requirements
-        for keyword in english_keywords:
-            if keyword in text_to_check:
-                return True
-                
-        return False
-
-    def save_jobs_to_database(self, jobs_data: List[Dict], db: Session):
-        """Save scraped jobs to database"""
-        saved_count = 0
-        
-        for job_data in jobs_data:
-            try:
-                # Check if job already exists
-                existing_job = db.query(Job).filter(
-                    Job.linkedin_job_id == job_data['linkedin_job_id']
-                ).first()
-                
-                if not existing_job:
-                    job = Job(**job_data)
-                    db.add(job)
-                    saved_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Error saving job: {e}")
-                continue
-                
-        try:
-            db.commit()
-        except Exception as e:
-            logger.error(f"Error committing jobs: {e}")
-            db.rollback()
-            
-        return saved_count
-
-    def close(self):
-        """Close the webdriver"""
-        if hasattr(self, 'driver') and self.driver:
-            self.driver.quit()
-    
-    def __del__(self):
-        self.close()
-
-
-def search_multiple_regions(search_term: str = "DevOps", max_jobs_per_region: int = 20) -> Dict:
-    """Search jobs across multiple Spanish-speaking regions"""
-    regions = [
-        "España", "México", "Argentina", "Colombia", "Chile", 
-        "Perú", "Venezuela", "Ecuador", "Guatemala", "Costa Rica"
-    ]
-    
-    all_results = {}
-    
-    for region in regions:
-        try:
-            scraper = LinkedInScraper()
-            jobs = scraper.search_jobs(search_term, region, max_jobs_per_region)
-            all_results[region] = jobs
-            scraper.close()
-            
-        except Exception as e:
-            logger.error(f"Error scraping {region}: {e}")
-            all_results[region] = []
-    
-    return all_results
-
-
-def run_scheduled_scraping(search_term: str = "DevOps", location: str = "España", 
-                          max_jobs: int = 100) -> Dict:
-    """Run scheduled scraping and save to database"""
-    
-    # Create database session
-    db = next(get_db())
-    
-    # Create scrape log entry
-    scrape_log = ScrapeLog(
-        search_term=search_term,
-        location=location,
-        started_at=datetime.utcnow(),
-        success=False
-    )
-    
-    try:
-        # Initialize scraper
-        scraper = LinkedInScraper()
-        
-        # Search jobs
-        jobs_data = scraper.search_jobs(search_term, location, max_jobs)
-        
-        # Save to database
-        saved_count = scraper.save_jobs_to_database(jobs_data, db)
-        
-        # Update scrape log
-        scrape_log.jobs_found = len(jobs_data)
-        scrape_log.jobs_saved = saved_count
-        scrape_log.success = True
-        scrape_log.completed_at = datetime.utcnow()
-        
-        result = {
-            'success': True,
-            'jobs_found': len(jobs_data),
-            'jobs_saved': saved_count,
-            'jobs_without_english': len([j for j in jobs_data if not j['requires_english']])
-        }
-        
-    except Exception as e:
-        logger.error(f"Scraping failed: {e}")
-        scrape_log.success = False
-        scrape_log.error_message = str(e)
-        scrape_log.completed_at = datetime.utcnow()
-        
-        result = {
-            'success': False,
-            'error': str(e)
-        }
-    
-    finally:
-        # Save scrape log
-        db.add(scrape_log)
-        db.commit()
-        db.close()
-        scraper.close()
-    
-    return result
\ No newline at end of file
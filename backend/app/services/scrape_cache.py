@@ -0,0 +1,63 @@
+"""
+Scrape Cache
+Caché en disco de resultados de scraping por búsqueda
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# One JSON file per (search_term, location, max_jobs); override for containers
+CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "winjob"))
+CACHE_TTL_SECONDS = int(os.getenv("SCRAPE_CACHE_TTL_SECONDS", "3600"))
+# Job fields serialized as ISO strings that must be datetimes again for the ORM
+_DATETIME_FIELDS = ("posted_date", "scraped_at")
+
+
+def _cache_path(key: tuple) -> str:
+    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.json")
+
+
+def get(key: tuple, ttl_seconds: int = CACHE_TTL_SECONDS) -> Optional[List[Dict]]:
+    """Return the cached jobs for key if written less than ttl_seconds ago"""
+    path = _cache_path(key)
+    try:
+        if time.time() - os.path.getmtime(path) > ttl_seconds:
+            return None
+        with open(path, "rb") as f:
+            jobs_data = orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable scrape cache {path}: {e}")
+        return None
+
+    for job in jobs_data:
+        for field in _DATETIME_FIELDS:
+            if job.get(field):
+                job[field] = datetime.fromisoformat(job[field])
+    return jobs_data
+
+
+def put(key: tuple, jobs_data: List[Dict]):
+    """Write jobs for key atomically (temp file + os.replace)"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(jobs_data))
+            os.replace(tmp_path, _cache_path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write scrape cache: {e}")
@@ -0,0 +1,15 @@
+"""
+Create Job Indexes
+Crea en una base existente los índices de jobs declarados después de crear la tabla
+
+One-off maintenance task, run from backend/ after deploying a release that
+declares new indexes: python create_job_indexes.py
+"""
+
+import logging
+from app.database.database import engine
+from app.models.models import create_missing_job_indexes
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    create_missing_job_indexes(engine)
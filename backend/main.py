@@ -1,18 +1,33 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
 from app.api import jobs, auth, users
 from app.database.database import engine
 from app.models.models import Base
+from app.services.linkedin_http import create_http_client
+from app.services.linkedin_oauth_service import LinkedInOAuthService
 import os
 
-# Create database tables
+# Create database tables (indexes added later: see create_job_indexes.py)
 Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled HTTP client per worker, reused by every LinkedIn call
+    app.state.http = create_http_client()
+    # Stateless OAuth service shared by all requests, on the same client
+    app.state.linkedin_oauth = LinkedInOAuthService(app.state.http)
+    yield
+    await app.state.http.aclose()
+
 app = FastAPI(
     title="DevOps Job Scraper API",
     description="API para extraer y gestionar ofertas de trabajo DevOps desde LinkedIn",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Security middleware
@@ -25,6 +40,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count"],
 )
 
 # Include routers
@@ -1,46 +1,65 @@
 import pytest
 import sys
 import os
+from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 # Add the backend directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database.database import get_db, Base
+from app.database.database import get_db
 from main import app
+from app.api.jobs import _ACTIVE_JOBS_STMT, _invalidate_job_caches
+from app.services import scrape_cache
+from app.services.english_detection import flag_english_requirements
+from app.services.job_storage import save_new_jobs, refresh_english_requirements
+from app.services.auth_service import AuthService, _user_cache
 
 # Import models to ensure they are registered with Base
-from app.models import models
-
-# Test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+from app.models.models import Base, Job
 
+# Test database: one in-memory SQLite connection shared by every thread
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
+# Let SQLAlchemy emit BEGIN itself so pysqlite honours the per-test SAVEPOINTs
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
-app.dependency_overrides[get_db] = override_get_db
+# Create all tables once for the whole session
+Base.metadata.create_all(bind=engine)
 
 @pytest.fixture(autouse=True)
-def setup_and_teardown():
-    # Setup: Create all tables
-    Base.metadata.create_all(bind=engine)
-    yield
-    # Teardown: Drop all tables
-    Base.metadata.drop_all(bind=engine)
+def db_session():
+    # Each test runs inside an outer transaction that is rolled back
+    # afterwards; route commits only release SAVEPOINTs
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint",
+                      autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    # Cached listings/stats must not leak rows from a rolled-back test
+    _invalidate_job_caches()
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
 
 client = TestClient(app)
 
@@ -76,8 +95,186 @@ def test_login_endpoint_exists():
     # Should return validation error, not 404
     assert response.status_code in [400, 422, 500]
 
+def _job(linkedin_job_id, **fields):
+    job = {
+        "title": f"DevOps Engineer {linkedin_job_id}",
+        "company": "TechCorp",
+        "location": "Santiago, Chile",
+        "description": "Trabajo en español",
+        "linkedin_job_id": linkedin_job_id,
+        "linkedin_url": f"https://linkedin.com/jobs/view/{linkedin_job_id}",
+        "posted_date": datetime(2024, 1, 1),
+        "requires_english": False,
+        "is_active": True
+    }
+    job.update(fields)
+    return job
+
 def test_get_jobs_endpoint_exists():
-    # Test that the endpoint exists
     response = client.get("/api/v1/jobs/")
-    # Should return response, not 404 (500 is acceptable if DB is not setup)
-    assert response.status_code in [200, 500]
\ No newline at end of file
+    assert response.status_code == 200
+    assert response.json() == []
+
+def test_get_jobs_rejects_invalid_cursor():
+    response = client.get("/api/v1/jobs/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+def test_get_jobs_cursor_continues_after_previous_page(db_session):
+    save_new_jobs(db_session, [
+        _job(str(n), posted_date=datetime(2024, 1, 1) + timedelta(days=n)) for n in range(5)
+    ])
+    db_session.commit()
+
+    first = client.get("/api/v1/jobs/", params={"limit": 2})
+    assert first.status_code == 200
+    assert first.headers["x-total-count"] == "5"
+    cursor = first.headers["x-next-cursor"]
+
+    second = client.get("/api/v1/jobs/", params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+    assert "x-total-count" not in second.headers
+    ids = [job["linkedin_url"].rsplit("/", 1)[-1] for job in first.json() + second.json()]
+    assert ids == ["4", "3", "2", "1"]
+
+def test_get_jobs_sorts_undated_jobs_last(db_session):
+    save_new_jobs(db_session, [
+        _job("undated", posted_date=None),
+        *[_job(str(n), posted_date=datetime(2024, 1, 1) + timedelta(days=n)) for n in range(3)]
+    ])
+    db_session.commit()
+
+    first = client.get("/api/v1/jobs/", params={"limit": 2})
+    second = client.get("/api/v1/jobs/", params={"limit": 2, "cursor": first.headers["x-next-cursor"]})
+    ids = [job["linkedin_url"].rsplit("/", 1)[-1] for job in first.json() + second.json()]
+    assert ids == ["2", "1", "0"]
+
+    everything = client.get("/api/v1/jobs/", params={"limit": 10}).json()
+    assert everything[-1]["linkedin_url"].endswith("/undated")
+    # SQLite already sorts NULLs last; PostgreSQL needs the explicit clause
+    assert "NULLS LAST" in str(_ACTIVE_JOBS_STMT.compile(dialect=postgresql.dialect()))
+
+def test_get_jobs_revalidates_with_etag():
+    response = client.get("/api/v1/jobs/", params={"limit": 5})
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, no-cache"
+    etag = response.headers["etag"]
+
+    response = client.get("/api/v1/jobs/", params={"limit": 5}, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+def test_get_jobs_cached_until_jobs_are_written(db_session):
+    assert client.get("/api/v1/jobs/").json() == []
+
+    # Written behind the API's back: the cached listing is still served
+    save_new_jobs(db_session, [_job("1")])
+    db_session.commit()
+    assert client.get("/api/v1/jobs/").json() == []
+
+    assert client.post("/api/v1/jobs/seed-test-data").status_code == 200
+    assert len(client.get("/api/v1/jobs/").json()) == 6
+
+def test_job_stats(db_session):
+    save_new_jobs(db_session, [
+        _job("1", requires_english=True),
+        _job("2", company="CloudSolutions"),
+        _job("3"),
+        _job("4", company="InnovaTech", location="Temuco, Chile"),
+        _job("5", is_active=False)
+    ])
+    db_session.commit()
+
+    response = client.get("/api/v1/jobs/stats/summary")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["total_jobs"] == 4
+    assert stats["jobs_without_english"] == 3
+    assert stats["english_percentage"] == 25.0
+    assert stats["top_companies"] == [
+        {"name": "TechCorp", "count": 2},
+        {"name": "CloudSolutions", "count": 1},
+        {"name": "InnovaTech", "count": 1}
+    ]
+    assert stats["top_locations"] == [
+        {"name": "Santiago, Chile", "count": 3},
+        {"name": "Temuco, Chile", "count": 1}
+    ]
+
+def test_seed_test_data_reports_only_inserted_jobs(db_session):
+    save_new_jobs(db_session, [_job("test-job-001"), _job("test-job-004")])
+    db_session.commit()
+
+    created = client.post("/api/v1/jobs/seed-test-data").json()
+    assert created["jobs_created"] == 3
+    assert created["job_titles"] == [
+        "Senior DevOps Engineer - TEST", "DevOps Specialist - TEST", "Infrastructure Engineer - TEST"
+    ]
+
+    again = client.post("/api/v1/jobs/seed-test-data").json()
+    assert "jobs_created" not in again
+    assert again["message"] == "Test data already exists (all test jobs are already stored)"
+
+def test_job_stats_cached_until_jobs_are_written(db_session):
+    save_new_jobs(db_session, [_job("1")])
+    db_session.commit()
+    assert client.get("/api/v1/jobs/stats/summary").json()["total_jobs"] == 1
+
+    # Written behind the API's back: the cached summary is still served
+    save_new_jobs(db_session, [_job("2")])
+    db_session.commit()
+    assert client.get("/api/v1/jobs/stats/summary").json()["total_jobs"] == 1
+
+    assert client.post("/api/v1/jobs/seed-test-data").status_code == 200
+    assert client.get("/api/v1/jobs/stats/summary").json()["total_jobs"] == 7
+
+def test_refresh_english_requirements_rewrites_changed_flags(db_session):
+    save_new_jobs(db_session, [
+        _job("1", description="Fluent English required"),
+        _job("2"),
+        _job("3", title="SRE bilingual", requires_english=True)
+    ])
+
+    assert refresh_english_requirements(db_session) == 1
+    flags = db_session.execute(
+        select(Job.linkedin_job_id, Job.requires_english).order_by(Job.linkedin_job_id)
+    ).all()
+    assert [tuple(row) for row in flags] == [("1", True), ("2", False), ("3", True)]
+
+def test_save_new_jobs_skips_duplicates(db_session):
+    assert save_new_jobs(db_session, [_job("1"), _job("2"), _job("1", title="Repeat")]) == 2
+    assert save_new_jobs(db_session, [_job("2"), _job("3")]) == 1
+    assert save_new_jobs(db_session, []) == 0
+
+def test_flag_english_requirements_maps_hits_to_jobs():
+    jobs = [
+        {"title": "DevOps", "description": "Equipo local"},
+        {"title": "SRE bilingual", "description": None},
+        {"title": "Cloud", "description": "Buen nivel de inglés"},
+        {"title": "Platform", "description": ""}
+    ]
+    flag_english_requirements(jobs)
+    assert [job["requires_english"] for job in jobs] == [False, True, True, False]
+
+def test_scrape_cache_expires_after_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr(scrape_cache, "CACHE_DIR", str(tmp_path))
+    key = ("DevOps", "Chile", 10)
+    scrape_cache.put(key, [_job("1")])
+
+    cached = scrape_cache.get(key, ttl_seconds=60)
+    assert cached[0]["linkedin_job_id"] == "1"
+    assert cached[0]["posted_date"] == datetime(2024, 1, 1)
+
+    stale = os.path.getmtime(scrape_cache._cache_path(key)) - 120
+    os.utime(scrape_cache._cache_path(key), (stale, stale))
+    assert scrape_cache.get(key, ttl_seconds=60) is None
+
+def test_deactivating_user_drops_cached_snapshot(db_session):
+    auth_service = AuthService(db_session)
+    user = auth_service.create_user("cache@example.com", "secret-password")
+    token = auth_service.create_access_token({"sub": user.email})
+    assert auth_service.get_current_user(token).is_active
+    assert "cache@example.com" in _user_cache
+
+    user.is_active = False
+    db_session.commit()
+    assert "cache@example.com" not in _user_cache
+    assert not auth_service.get_current_user(token).is_active
@@ -11,6 +11,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 from datetime import datetime
 import logging
 from app.services.linkedin_api_service import LinkedInAPIService
+from app.database.database import SessionLocal
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
@@ -102,7 +103,8 @@ def main():
         # Save to database
         if jobs:
             print(f"\n💾 Guardando {len(jobs)} trabajos en base de datos...")
-            saved_count = service.save_jobs_to_database(jobs)
+            with SessionLocal() as db:
+                saved_count = service.save_jobs_to_database(jobs, db)
             print(f"✅ {saved_count} trabajos guardados correctamente")
         
         print("\n🎉 Demo completada!")